@@ -0,0 +1,12 @@
+"""
+Aura Compatibility Shims
+========================
+
+Settings that depend on the running Python version, defined once and
+imported wherever they are needed.
+"""
+
+import sys
+
+# slots=True drops the per-instance __dict__ but needs Python 3.10+
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
@@ -10,25 +10,100 @@ Author: Aura - Level 9 Autonomous AI Coding Assistant
 """
 
 import asyncio
+import hashlib
 import json
 import time
 import logging
 import httpx
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, Union
 import ast
 import os
+import re
+import sys
 from dataclasses import dataclass, asdict
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import numpy as np
+from functools import lru_cache
+import math
+
+from aura_compat import DATACLASS_SLOTS
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - AURA - %(levelname)s - %(message)s')
 logger = logging.getLogger('aura_demo')
 
+BANNER = """
+╔══════════════════════════════════════════════════════════════╗
+║                                                              ║
+║     ░█████╗░██╗░░░██╗██████╗░░█████╗░                       ║
+║     ██╔══██╗██║░░░██║██╔══██╗██╔══██╗                       ║
+║     ███████║██║░░░██║██████╔╝███████║                       ║
+║     ██╔══██║██║░░░██║██╔══██╗██╔══██║                       ║
+║     ██║░░██║╚██████╔╝██║░░██║██║░░██║                       ║
+║     ╚═╝░░╚═╝░╚═════╝░╚═╝░░╚═╝╚═╝░░╚═╝                       ║
+║                                                              ║
+║         Level 9 Autonomous AI Coding Assistant              ║
+║                    Quick Demo                               ║
+║                                                              ║
+╚══════════════════════════════════════════════════════════════╝
+"""
+
+# Message templates for structured visitor issues, formatted only on display
+ISSUE_MESSAGES = {
+    'function_no_doc': "Function '{0}' at line {1} lacks documentation",
+    'class_no_doc': "Class '{0}' at line {1} lacks documentation",
+    'high_complexity': "Function '{0}' at line {1} has high complexity ({2})",
+    'function_error': "Error analyzing function '{0}': {2}",
+    'class_error': "Error analyzing class '{0}': {2}",
+}
+
+# Directories never descended into when scanning a codebase
+EXCLUDED_SCAN_DIRS = frozenset({'venv', '.venv', '__pycache__', '.git', 'node_modules'})
+
+# On-disk cache of per-file analyses, reused across runs; kept outside any scanned tree
+ANALYSIS_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'aura' / 'analysis'
 
-@dataclass
+# Bumped whenever the cached JSON layout changes, so stale entries are never read
+ANALYSIS_CACHE_VERSION = 1
+
+# Lines whose first non-blank character is not a comment marker
+CODE_LINE_PATTERN = re.compile(rb'(?m)^[ \t\f\v\r]*[^\s#]')
+
+# Node types that add a branch to cyclomatic complexity
+CONTROL_FLOW_NODES = frozenset({ast.If, ast.While, ast.For, ast.AsyncFor, ast.ExceptHandler})
+BOOLEAN_OP_NODES = frozenset({ast.And, ast.Or})
+
+# Corpora smaller than this are densified and scored with the JIT kernel
+DENSE_SEARCH_MAX_FILES = 10_000
+
+
+def _dense_cosine(a, B, out):
+    """Cosine similarity of one dense vector against each row of B, written into out"""
+    for i in range(B.shape[0]):
+        s = 0.0
+        na = 0.0
+        nb = 0.0
+        for j in range(a.shape[0]):
+            x = a[j]
+            y = B[i, j]
+            s += x * y
+            na += x * x
+            nb += y * y
+        denom = math.sqrt(na * nb)
+        out[i] = s / denom if denom > 0.0 else 0.0
+    return out
+
+
+@lru_cache(maxsize=None)
+def get_dense_cosine_kernel():
+    """JIT-compile the dense cosine kernel on first use; None if numba is not installed"""
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True, fastmath=True)(_dense_cosine)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class CodeElement:
     """Represents a code element (function, class, etc.)"""
     name: str
@@ -45,17 +120,33 @@ class CodeElement:
             self.parameters = []
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CodeAnalysis:
     """Results of code analysis"""
     file_path: str
     elements: List[CodeElement]
     metrics: Dict[str, Any]
-    errors: List[str]
-    warnings: List[str]
+    errors: List[Union[str, Tuple]]
+    warnings: List[Union[str, Tuple]]
     timestamp: float
 
 
+def format_issue(issue: Union[str, Tuple]) -> str:
+    """Render a structured (kind, name, line[, detail]) issue as a message"""
+    if isinstance(issue, str):
+        return issue
+    return ISSUE_MESSAGES[issue[0]].format(*issue[1:])
+
+
+def iter_python_files(directory: str):
+    """Yield Python files under directory, pruning excluded directories before descending"""
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = [d for d in dirs if d not in EXCLUDED_SCAN_DIRS]
+        for name in files:
+            if name.endswith('.py'):
+                yield os.path.join(root, name)
+
+
 class SimpleASTVisitor(ast.NodeVisitor):
     """Simple AST visitor for Python code analysis"""
     
@@ -69,11 +160,7 @@ class SimpleASTVisitor(ast.NodeVisitor):
         """Visit function definitions"""
         try:
             # Get docstring
-            docstring = None
-            if (node.body and isinstance(node.body[0], ast.Expr) and 
-                isinstance(node.body[0].value, ast.Constant) and 
-                isinstance(node.body[0].value.value, str)):
-                docstring = node.body[0].value.value
+            docstring = ast.get_docstring(node, clean=False)
             
             # Get parameters
             parameters = [arg.arg for arg in node.args.args]
@@ -98,13 +185,13 @@ class SimpleASTVisitor(ast.NodeVisitor):
             
             # Check for issues
             if not docstring and not node.name.startswith('_'):
-                self.warnings.append(f"Function '{node.name}' at line {node.lineno} lacks documentation")
+                self.warnings.append(('function_no_doc', node.name, node.lineno))
             
             if complexity > 10:
-                self.warnings.append(f"Function '{node.name}' at line {node.lineno} has high complexity ({complexity})")
+                self.warnings.append(('high_complexity', node.name, node.lineno, complexity))
                 
         except Exception as e:
-            self.errors.append(f"Error analyzing function '{node.name}': {str(e)}")
+            self.errors.append(('function_error', node.name, node.lineno, str(e)))
         
         self.generic_visit(node)
     
@@ -115,11 +202,7 @@ class SimpleASTVisitor(ast.NodeVisitor):
             self.current_class = node.name
             
             # Get docstring
-            docstring = None
-            if (node.body and isinstance(node.body[0], ast.Expr) and 
-                isinstance(node.body[0].value, ast.Constant) and 
-                isinstance(node.body[0].value.value, str)):
-                docstring = node.body[0].value.value
+            docstring = ast.get_docstring(node, clean=False)
             
             element = CodeElement(
                 name=node.name,
@@ -133,25 +216,25 @@ class SimpleASTVisitor(ast.NodeVisitor):
             
             # Check for issues
             if not docstring:
-                self.warnings.append(f"Class '{node.name}' at line {node.lineno} lacks documentation")
+                self.warnings.append(('class_no_doc', node.name, node.lineno))
             
             self.generic_visit(node)
             self.current_class = old_class
             
         except Exception as e:
-            self.errors.append(f"Error analyzing class '{node.name}': {str(e)}")
+            self.errors.append(('class_error', node.name, node.lineno, str(e)))
     
     def _calculate_complexity(self, node):
         """Calculate cyclomatic complexity"""
         complexity = 1  # Base complexity
         
-        for child in ast.walk(node):
-            if isinstance(child, (ast.If, ast.While, ast.For, ast.AsyncFor)):
-                complexity += 1
-            elif isinstance(child, ast.ExceptHandler):
-                complexity += 1
-            elif isinstance(child, (ast.And, ast.Or)):
-                complexity += 1
+        # Explicit stack instead of ast.walk: no generator frame per visited node
+        stack = [node]
+        while stack:
+            child = stack.pop()
+            t = type(child)
+            complexity += (t in CONTROL_FLOW_NODES) + (t in BOOLEAN_OP_NODES)
+            stack.extend(ast.iter_child_nodes(child))
         
         return complexity
 
@@ -161,7 +244,10 @@ class SimpleLLMClient:
     
     def __init__(self, base_url: str = "http://localhost:1234"):
         self.base_url = base_url
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16)
+        )
         
     async def generate(self, prompt: str, max_tokens: int = 1000, temperature: float = 0.3) -> Optional[str]:
         """Generate response from LLM"""
@@ -187,6 +273,16 @@ class SimpleLLMClient:
             logger.error(f"LLM request error: {e}")
             return None
     
+    async def batch_generate(self, prompts: List[str], concurrency: int = 8, **kwargs) -> List[Optional[str]]:
+        """Generate responses for several prompts concurrently over the shared connection pool"""
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def generate_one(prompt: str) -> Optional[str]:
+            async with semaphore:
+                return await self.generate(prompt, **kwargs)
+        
+        return await asyncio.gather(*(generate_one(prompt) for prompt in prompts))
+    
     async def check_health(self) -> bool:
         """Check if LLM is available"""
         try:
@@ -202,28 +298,16 @@ class AuraDemo:
     def __init__(self):
         self.llm = SimpleLLMClient()
         self.code_analyses = {}
-        self.vectorizer = TfidfVectorizer(stop_words='english', max_features=1000)
+        self.vectorizer = None  # Built on first scan so sklearn is only imported when needed
         self.code_vectors = None
+        self.dense_code_vectors = None
         self.file_paths = []
         
     def print_banner(self):
         """Print Aura banner"""
-        banner = """
-╔══════════════════════════════════════════════════════════════╗
-║                                                              ║
-║     ░█████╗░██╗░░░██╗██████╗░░█████╗░                       ║
-║     ██╔══██╗██║░░░██║██╔══██╗██╔══██╗                       ║
-║     ███████║██║░░░██║██████╔╝███████║                       ║
-║     ██╔══██║██║░░░██║██╔══██╗██╔══██║                       ║
-║     ██║░░██║╚██████╔╝██║░░██║██║░░██║                       ║
-║     ╚═╝░░╚═╝░╚═════╝░╚═╝░░╚═╝╚═╝░░╚═╝                       ║
-║                                                              ║
-║         Level 9 Autonomous AI Coding Assistant              ║
-║                    Quick Demo                               ║
-║                                                              ║
-╚══════════════════════════════════════════════════════════════╝
-        """
-        print(banner)
+        if not sys.stdout.isatty():
+            return
+        sys.stdout.write(BANNER)
     
     async def check_llm_connection(self) -> bool:
         """Check LLM connection"""
@@ -239,25 +323,47 @@ class AuraDemo:
         """Analyze a Python file"""
         print(f"🔍 Analyzing file: {file_path}")
         
+        cache_path = self._analysis_cache_path(file_path)
+        cached = self._load_cached_analysis(cache_path)
+        if cached is not None:
+            self.code_analyses[file_path] = cached
+            return cached
+        
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                source_code = f.read()
+            # Read raw bytes; ast.parse honours the PEP 263 coding cookie itself
+            with open(file_path, 'rb') as f:
+                source_bytes = f.read()
             
             # Parse AST
-            tree = ast.parse(source_code)
+            tree = ast.parse(source_bytes, filename=file_path)
             visitor = SimpleASTVisitor()
             visitor.visit(tree)
             
-            # Calculate metrics
-            lines = source_code.split('\n')
+            # Calculate metrics in a single pass over the elements
+            functions_count = classes_count = methods_count = 0
+            complexity_sum = documented_count = 0
+            for element in visitor.elements:
+                if element.type == 'function':
+                    functions_count += 1
+                    complexity_sum += element.complexity
+                elif element.type == 'method':
+                    methods_count += 1
+                    complexity_sum += element.complexity
+                elif element.type == 'class':
+                    classes_count += 1
+                if element.docstring:
+                    documented_count += 1
+            
+            callables_count = functions_count + methods_count
+            elements_count = len(visitor.elements)
             metrics = {
-                'lines_of_code': len([line for line in lines if line.strip() and not line.strip().startswith('#')]),
-                'total_lines': len(lines),
-                'functions_count': len([e for e in visitor.elements if e.type == 'function']),
-                'classes_count': len([e for e in visitor.elements if e.type == 'class']),
-                'methods_count': len([e for e in visitor.elements if e.type == 'method']),
-                'average_complexity': np.mean([e.complexity for e in visitor.elements if e.type in ['function', 'method']]) if visitor.elements else 0,
-                'documentation_coverage': len([e for e in visitor.elements if e.docstring]) / len(visitor.elements) if visitor.elements else 0
+                'lines_of_code': len(CODE_LINE_PATTERN.findall(source_bytes)),
+                'total_lines': source_bytes.count(b'\n') + 1,
+                'functions_count': functions_count,
+                'classes_count': classes_count,
+                'methods_count': methods_count,
+                'average_complexity': complexity_sum / callables_count if callables_count else 0,
+                'documentation_coverage': documented_count / elements_count if elements_count else 0
             }
             
             analysis = CodeAnalysis(
@@ -270,6 +376,7 @@ class AuraDemo:
             )
             
             self.code_analyses[file_path] = analysis
+            self._store_cached_analysis(cache_path, analysis)
             return analysis
             
         except Exception as e:
@@ -283,20 +390,59 @@ class AuraDemo:
                 timestamp=time.time()
             )
     
+    def _analysis_cache_path(self, file_path: str) -> Optional[Path]:
+        """Cache location for a file, keyed by path, mtime and size"""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        key = hashlib.blake2b(
+            f"{ANALYSIS_CACHE_VERSION}|{os.path.abspath(file_path)}|{st.st_mtime_ns}|{st.st_size}".encode('utf-8'),
+            digest_size=16
+        ).hexdigest()
+        return ANALYSIS_CACHE_DIR / f"{key}.json"
+    
+    def _load_cached_analysis(self, cache_path: Optional[Path]) -> Optional[CodeAnalysis]:
+        """Load a previously stored analysis, if any"""
+        if cache_path is None:
+            return None
+        try:
+            # Only trust entries written by the current user
+            if hasattr(os, 'getuid') and cache_path.stat().st_uid != os.getuid():
+                logger.debug(f"Ignoring analysis cache {cache_path} owned by another user")
+                return None
+            data = json.loads(cache_path.read_bytes())
+            data['elements'] = [CodeElement(**element) for element in data['elements']]
+            data['errors'] = [issue if isinstance(issue, str) else tuple(issue) for issue in data['errors']]
+            data['warnings'] = [issue if isinstance(issue, str) else tuple(issue) for issue in data['warnings']]
+            return CodeAnalysis(**data)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable analysis cache {cache_path}: {e}")
+            return None
+    
+    def _store_cached_analysis(self, cache_path: Optional[Path], analysis: CodeAnalysis):
+        """Persist an analysis so unchanged files are not re-parsed next run"""
+        if cache_path is None:
+            return
+        try:
+            ANALYSIS_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps(asdict(analysis)), encoding='utf-8')
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not write analysis cache {cache_path}: {e}")
+    
     def scan_codebase(self, directory: str = ".") -> List[CodeAnalysis]:
         """Scan entire codebase"""
         print(f"🔍 Scanning codebase in: {directory}")
         
         analyses = []
-        python_files = list(Path(directory).rglob("*.py"))
+        python_files = list(iter_python_files(directory))
         
         print(f"Found {len(python_files)} Python files")
         
         for file_path in python_files:
-            if 'venv' in str(file_path) or '__pycache__' in str(file_path):
-                continue
-                
-            analysis = self.analyze_file(str(file_path))
+            analysis = self.analyze_file(file_path)
             analyses.append(analysis)
         
         # Build search index
@@ -316,7 +462,16 @@ class AuraDemo:
                 self.file_paths.append(analysis.file_path)
             
             if texts:
+                import numpy as np
+                from sklearn.feature_extraction.text import TfidfVectorizer
+                
+                if self.vectorizer is None:
+                    self.vectorizer = TfidfVectorizer(stop_words='english', max_features=1000)
                 self.code_vectors = self.vectorizer.fit_transform(texts)
+                self.dense_code_vectors = None
+                if (self.code_vectors.shape[0] < DENSE_SEARCH_MAX_FILES and
+                        get_dense_cosine_kernel() is not None):
+                    self.dense_code_vectors = self.code_vectors.toarray().astype(np.float32)
         
         return analyses
     
@@ -328,23 +483,38 @@ class AuraDemo:
         
         print(f"🔍 Searching for: '{query}'")
         
+        import numpy as np
+        
         # Vectorize query
         query_vector = self.vectorizer.transform([query])
         
         # Calculate similarities
-        similarities = cosine_similarity(query_vector, self.code_vectors).flatten()
+        if self.dense_code_vectors is not None:
+            dense_query = query_vector.toarray().ravel().astype(np.float32)
+            similarities = get_dense_cosine_kernel()(
+                dense_query,
+                self.dense_code_vectors,
+                np.empty(self.dense_code_vectors.shape[0], np.float32)
+            )
+        else:
+            from sklearn.metrics.pairwise import cosine_similarity
+            similarities = cosine_similarity(query_vector, self.code_vectors).flatten()
         
-        # Get top results
-        top_indices = similarities.argsort()[-limit:][::-1]
+        # Get top results (partition first, then sort only the top k)
+        k = min(limit, similarities.size)
+        if k <= 0:
+            return []
+        top_indices = np.argpartition(similarities, -k)[-k:]
+        top_indices = top_indices[np.argsort(-similarities[top_indices])]
+        top_indices = top_indices[similarities[top_indices] > 0.1]  # Minimum similarity threshold
         
         results = []
         for idx in top_indices:
-            if similarities[idx] > 0.1:  # Minimum similarity threshold
-                results.append({
-                    'file_path': self.file_paths[idx],
-                    'similarity': float(similarities[idx]),
-                    'analysis': self.code_analyses[self.file_paths[idx]]
-                })
+            results.append({
+                'file_path': self.file_paths[idx],
+                'similarity': float(similarities[idx]),
+                'analysis': self.code_analyses[self.file_paths[idx]]
+            })
         
         return results
     
@@ -401,12 +571,12 @@ Please provide a helpful, technical response based on the codebase analysis abov
         if analysis.errors:
             print(f"\n❌ Errors:")
             for error in analysis.errors:
-                print(f"  • {error}")
+                print(f"  • {format_issue(error)}")
         
         if analysis.warnings:
             print(f"\n⚠️  Warnings:")
             for warning in analysis.warnings:
-                print(f"  • {warning}")
+                print(f"  • {format_issue(warning)}")
     
     def display_search_results(self, results: List[Dict[str, Any]]):
         """Display search results"""
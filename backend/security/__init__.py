@@ -63,7 +63,7 @@ DEFAULT_SECURITY_CONFIG = {
         ]
     },
     'encryption': {
-        'algorithm': 'fernet',
+        'algorithm': 'aes-256-gcm',
         'key_derivation_iterations': 100000
     },
     'network': {
@@ -123,11 +123,10 @@ class SecurityManager:
             ])
         ]
         
-        for service_id, permissions in services:
-            try:
-                self.auth_manager.register_service(service_id, permissions)
-            except Exception as e:
-                print(f"Warning: Could not register service {service_id}: {e}")
+        try:
+            self.auth_manager.register_services(services)
+        except Exception as e:
+            print(f"Warning: Could not register default services: {e}")
     
     def authenticate_request(self, service_id: str, token: str) -> ServiceContext:
         """Authenticate request and return service context"""
@@ -180,7 +179,7 @@ class SecurityManager:
                 'allowed_hosts': len(self.http_client.allowed_hosts)
             },
             'encryption': {
-                'algorithm': 'fernet',
+                'algorithm': 'aes-256-gcm',
                 'status': 'active'
             }
         }
\ No newline at end of file
@@ -1,10 +1,31 @@
-import jwt
+import os
+import hmac
+import json
 import time
+import base64
 import secrets
 import hashlib
-from typing import Dict, Optional, List
+from collections import OrderedDict
+from typing import Dict, Optional, List, Tuple
 from dataclasses import dataclass
 
+
+def _b64url_encode(data: bytes) -> bytes:
+    """Base64url-encode without padding, as required by RFC 7515"""
+    return base64.urlsafe_b64encode(data).rstrip(b'=')
+
+
+def _b64url_decode(data: bytes) -> bytes:
+    """Decode unpadded base64url data"""
+    return base64.urlsafe_b64decode(data + b'=' * (-len(data) % 4))
+
+
+# Entropy per generated API key (matches secrets.token_urlsafe(32))
+API_KEY_BYTES = 32
+
+# HS256 is the only algorithm Aura issues, so the JOSE header is constant
+_JWT_HEADER = _b64url_encode(b'{"alg":"HS256","typ":"JWT"}')
+
 @dataclass
 class ServiceCredentials:
     service_id: str
@@ -19,14 +40,16 @@ class AuthenticationError(Exception):
 class AuthenticationManager:
     """Manage authentication for Aura services"""
 
-    def __init__(self, secret_key: str):
+    def __init__(self, secret_key: str, max_cached_tokens: int = 4096):
         self.secret_key = secret_key
+        self._secret_bytes = secret_key.encode('utf-8')
         self.service_registry: Dict[str, ServiceCredentials] = {}
-        self.token_cache: Dict[str, Dict] = {}
+        self.token_cache: 'OrderedDict[str, Dict]' = OrderedDict()
+        self.max_cached_tokens = max_cached_tokens
 
     def register_service(self, service_id: str, permissions: List[str]) -> str:
         """Register a new service and generate API key"""
-        api_key = secrets.token_urlsafe(32)
+        api_key = secrets.token_urlsafe(API_KEY_BYTES)
         credentials = ServiceCredentials(
             service_id=service_id,
             api_key=api_key,
@@ -35,6 +58,21 @@ class AuthenticationManager:
         self.service_registry[service_id] = credentials
         return api_key
 
+    def register_services(self, services: List[Tuple[str, List[str]]]) -> Dict[str, str]:
+        """Register several services at once, drawing all API keys from one urandom call"""
+        raw = os.urandom(API_KEY_BYTES * len(services))
+        api_keys = {}
+        for i, (service_id, permissions) in enumerate(services):
+            chunk = raw[i * API_KEY_BYTES:(i + 1) * API_KEY_BYTES]
+            api_key = _b64url_encode(chunk).decode('ascii')
+            self.service_registry[service_id] = ServiceCredentials(
+                service_id=service_id,
+                api_key=api_key,
+                permissions=permissions
+            )
+            api_keys[service_id] = api_key
+        return api_keys
+
     def authenticate_service(self, service_id: str, api_key: str) -> bool:
         """Authenticate a service using API key"""
         credentials = self.service_registry.get(service_id)
@@ -57,19 +95,51 @@ class AuthenticationManager:
             'iat': time.time(),
             'exp': time.time() + duration
         }
-        token = jwt.encode(payload, self.secret_key, algorithm='HS256')
-        self.token_cache[token] = payload
+        signing_input = _JWT_HEADER + b'.' + _b64url_encode(
+            json.dumps(payload, separators=(',', ':')).encode('utf-8')
+        )
+        token = (signing_input + b'.' + _b64url_encode(self._sign(signing_input))).decode('ascii')
+        self._cache_token(token, payload)
         return token
 
     def validate_jwt_token(self, token: str) -> Optional[Dict]:
         """Validate JWT token and return payload"""
+        # Tokens we issued or already verified only need their expiry checked
+        cached = self.token_cache.get(token)
+        if cached is not None:
+            if cached['exp'] < time.time():
+                self.token_cache.pop(token, None)
+                return None
+            self.token_cache.move_to_end(token)
+            return cached
+
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=['HS256'])
-            return payload
-        except jwt.ExpiredSignatureError:
-            return None
-        except jwt.InvalidTokenError:
+            header_b64, payload_b64, signature_b64 = token.encode('ascii').split(b'.')
+            header = json.loads(_b64url_decode(header_b64))
+            if header.get('alg') != 'HS256':
+                return None
+            expected = self._sign(header_b64 + b'.' + payload_b64)
+            if not hmac.compare_digest(expected, _b64url_decode(signature_b64)):
+                return None
+            payload = json.loads(_b64url_decode(payload_b64))
+            if 'exp' in payload and payload['exp'] < time.time():
+                return None
+        except (ValueError, TypeError, AttributeError, UnicodeError):
             return None
+        if isinstance(payload, dict) and 'exp' in payload:
+            self._cache_token(token, payload)
+        return payload
+
+    def _cache_token(self, token: str, payload: Dict):
+        """Remember a token, evicting the least recently used entry when full"""
+        self.token_cache[token] = payload
+        self.token_cache.move_to_end(token)
+        if len(self.token_cache) > self.max_cached_tokens:
+            self.token_cache.popitem(last=False)
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        """Compute the HS256 signature (OpenSSL-backed HMAC-SHA256)"""
+        return hmac.new(self._secret_bytes, signing_input, hashlib.sha256).digest()
 
     def check_permission(self, service_id: str, permission: str) -> bool:
         """Check if service has specific permission"""
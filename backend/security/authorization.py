@@ -1,6 +1,9 @@
 import time
 from functools import wraps
-from typing import List, Callable, Any
+from typing import Dict, List, Callable, Any, Optional, Tuple
+
+# Upper bound on memoized decisions per decorated function
+MAX_CACHED_DECISIONS = 4096
 
 class AuthorizationError(Exception):
     """Authorization-related error"""
@@ -16,15 +19,28 @@ class Permission:
 
 def require_permissions(permissions: List[str]):
     """Decorator to require specific permissions"""
+    required = frozenset(permissions)
+
     def decorator(func: Callable) -> Callable:
+        decisions: Dict[Tuple, bool] = {}
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
             service_context = kwargs.get('service_context')
             if not service_context:
                 raise AuthorizationError("No service context provided")
-            for permission in permissions:
-                if not service_context.has_permission(permission):
-                    raise AuthorizationError(f"Permission denied: {permission}")
+            # The version changes on revoke(), which invalidates earlier decisions
+            key = (service_context.service_id, service_context.version, service_context.permission_set)
+            allowed = decisions.get(key)
+            if allowed is None:
+                allowed = required <= service_context.permission_set
+                if len(decisions) >= MAX_CACHED_DECISIONS:
+                    decisions.clear()
+                decisions[key] = allowed
+            if not allowed:
+                for permission in permissions:
+                    if not service_context.has_permission(permission):
+                        raise AuthorizationError(f"Permission denied: {permission}")
             return await func(*args, **kwargs)
         return wrapper
     return decorator
@@ -35,8 +51,19 @@ class ServiceContext:
     def __init__(self, service_id: str, permissions: List[str]):
         self.service_id = service_id
         self.permissions = permissions
-        self.authenticated_at = time.time()
+        self.permission_set = frozenset(permissions)
+        self.version = 0
+        self.authenticated_at = time.monotonic_ns()  # monotonic, not wall-clock
+
+    def revoke(self, permissions: Optional[List[str]] = None):
+        """Revoke the given permissions (all if None) and invalidate cached decisions"""
+        if permissions is None:
+            self.permissions = []
+        else:
+            self.permissions = [p for p in self.permissions if p not in permissions]
+        self.permission_set = frozenset(self.permissions)
+        self.version += 1
 
     def has_permission(self, permission: str) -> bool:
         """Check if service has specific permission"""
-        return permission in self.permissions
\ No newline at end of file
+        return permission in self.permission_set
\ No newline at end of file
@@ -1,8 +1,59 @@
 import os
 import base64
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+import asyncio
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+KDF_ITERATIONS = 100000
+KEY_LENGTH = 32
+NONCE_LENGTH = 12
+TAG_LENGTH = 16
+FILE_CHUNK_SIZE = 1 << 20
+# Largest buffer kept in the per-thread pool, and how many are kept
+MAX_POOLED_BUFFER = 1 << 20
+MAX_POOLED_BUFFERS = 4
+
+_buffer_pool = threading.local()
+
+
+def derive_key(password: str, salt: bytes) -> bytes:
+    """Derive a raw key with PBKDF2-HMAC-SHA256 in a single OpenSSL call"""
+    return hashlib.pbkdf2_hmac('sha256', password.encode(), salt, KDF_ITERATIONS, KEY_LENGTH)
+
+
+def _available_cpus() -> int:
+    """CPUs this process may run on (respects affinity masks where supported)"""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+def _acquire_buffer(size: int) -> bytearray:
+    """Take a buffer of at least size bytes from this thread's pool"""
+    buffers = getattr(_buffer_pool, 'buffers', None)
+    if buffers:
+        for i, buffer in enumerate(buffers):
+            if len(buffer) >= size:
+                return buffers.pop(i)
+    return bytearray(size)
+
+
+def _release_buffer(buffer: bytearray, used: int):
+    """Wipe the first used bytes of a buffer and return it to this thread's pool"""
+    # Pooled buffers outlive the call, so plaintext must not be left behind
+    buffer[:used] = bytes(used)
+    if len(buffer) > MAX_POOLED_BUFFER:
+        return
+    buffers = getattr(_buffer_pool, 'buffers', None)
+    if buffers is None:
+        buffers = _buffer_pool.buffers = []
+    if len(buffers) < MAX_POOLED_BUFFERS:
+        buffers.append(buffer)
+
 
 class DataEncryption:
     """Handle encryption/decryption of sensitive data"""
@@ -10,39 +61,143 @@ class DataEncryption:
     def __init__(self, password: str, salt: bytes = None):
         if salt is None:
             salt = os.urandom(16)
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
-        self.cipher = Fernet(key)
+        self._setup(derive_key(password, salt), salt)
+
+    @classmethod
+    async def create(cls, password: str, salt: bytes = None) -> 'DataEncryption':
+        """Construct an instance without blocking the event loop on key derivation"""
+        return await asyncio.to_thread(cls, password, salt)
+
+    @classmethod
+    async def derive_many_async(cls, credentials: List[Tuple[str, Optional[bytes]]]) -> List['DataEncryption']:
+        """Async variant of derive_many"""
+        return await asyncio.to_thread(cls.derive_many, credentials)
+
+    @classmethod
+    def derive_many(cls, credentials: List[Tuple[str, Optional[bytes]]]) -> List['DataEncryption']:
+        """Create several instances, deriving their keys concurrently
+
+        hashlib.pbkdf2_hmac releases the GIL, so each derivation runs on its
+        own core.
+        """
+        if not credentials:
+            return []
+        passwords = [password for password, _ in credentials]
+        salts = [salt if salt is not None else os.urandom(16) for _, salt in credentials]
+        workers = min(len(credentials), _available_cpus())
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            keys = list(executor.map(derive_key, passwords, salts))
+        return [cls._from_key(key, salt) for key, salt in zip(keys, salts)]
+
+    @classmethod
+    def _from_key(cls, key: bytes, salt: bytes) -> 'DataEncryption':
+        """Build an instance around an already derived key"""
+        instance = cls.__new__(cls)
+        instance._setup(key, salt)
+        return instance
+
+    def _setup(self, key: bytes, salt: bytes):
+        """Initialise the cipher from a raw derived key"""
+        self._key = key
         self.salt = salt
 
     def encrypt(self, data: str) -> str:
-        """Encrypt string data"""
-        encrypted = self.cipher.encrypt(data.encode())
-        return base64.urlsafe_b64encode(encrypted).decode()
+        """Encrypt string data as base64url(nonce || ciphertext || tag)"""
+        plaintext = data.encode()
+        # update_into needs block_size - 1 spare bytes past the ciphertext
+        size = NONCE_LENGTH + len(plaintext) + TAG_LENGTH + 15
+        buffer = _acquire_buffer(size)
+        try:
+            with memoryview(buffer) as view:
+                nonce = os.urandom(NONCE_LENGTH)
+                encryptor = Cipher(algorithms.AES(self._key), modes.GCM(nonce)).encryptor()
+                view[:NONCE_LENGTH] = nonce
+                end = NONCE_LENGTH + encryptor.update_into(plaintext, view[NONCE_LENGTH:])
+                encryptor.finalize()
+                view[end:end + TAG_LENGTH] = encryptor.tag
+                return base64.urlsafe_b64encode(view[:end + TAG_LENGTH]).decode()
+        finally:
+            _release_buffer(buffer, size)
 
     def decrypt(self, encrypted_data: str) -> str:
-        """Decrypt string data"""
-        encrypted_bytes = base64.urlsafe_b64decode(encrypted_data.encode())
-        decrypted = self.cipher.decrypt(encrypted_bytes)
-        return decrypted.decode()
+        """Decrypt string data; raises InvalidTag if it was tampered with"""
+        sealed = base64.urlsafe_b64decode(encrypted_data.encode())
+        if len(sealed) < NONCE_LENGTH + TAG_LENGTH:
+            raise InvalidTag()
+        tag_start = len(sealed) - TAG_LENGTH
+        size = tag_start - NONCE_LENGTH + 15
+        buffer = _acquire_buffer(size)
+        try:
+            with memoryview(buffer) as view, memoryview(sealed) as sealed_view:
+                decryptor = Cipher(
+                    algorithms.AES(self._key),
+                    modes.GCM(sealed[:NONCE_LENGTH], sealed[tag_start:])
+                ).decryptor()
+                length = decryptor.update_into(sealed_view[NONCE_LENGTH:tag_start], view)
+                decryptor.finalize()
+                return str(view[:length], 'utf-8')
+        finally:
+            _release_buffer(buffer, size)
 
     def encrypt_file(self, file_path: str, output_path: str):
-        """Encrypt file contents"""
-        with open(file_path, 'rb') as f:
-            data = f.read()
-        encrypted = self.cipher.encrypt(data)
-        with open(output_path, 'wb') as f:
-            f.write(encrypted)
+        """Encrypt file contents
+
+        The file is streamed through AES-GCM in fixed-size chunks, so memory
+        use stays at two chunk buffers regardless of file size. The output
+        is raw nonce || ciphertext || tag, the same layout encrypt() returns
+        before base64 encoding.
+        """
+        nonce = os.urandom(NONCE_LENGTH)
+        encryptor = Cipher(algorithms.AES(self._key), modes.GCM(nonce)).encryptor()
+        with open(file_path, 'rb') as src, open(output_path, 'wb') as dst:
+            dst.write(nonce)
+            self._stream(encryptor, src, dst, os.fstat(src.fileno()).st_size)
+            encryptor.finalize()
+            dst.write(encryptor.tag)
 
     def decrypt_file(self, encrypted_path: str, output_path: str):
-        """Decrypt file contents"""
-        with open(encrypted_path, 'rb') as f:
-            encrypted_data = f.read()
-        decrypted = self.cipher.decrypt(encrypted_data)
-        with open(output_path, 'wb') as f:
-            f.write(decrypted)
\ No newline at end of file
+        """Decrypt file contents
+
+        Plaintext is written to a temporary file and only moved to
+        output_path once the authentication tag has been verified.
+        """
+        partial_path = output_path + '.partial'
+        with open(encrypted_path, 'rb') as src:
+            size = os.fstat(src.fileno()).st_size
+            if size < NONCE_LENGTH + TAG_LENGTH:
+                raise InvalidTag()
+            nonce = src.read(NONCE_LENGTH)
+            src.seek(size - TAG_LENGTH)
+            tag = src.read(TAG_LENGTH)
+            src.seek(NONCE_LENGTH)
+            decryptor = Cipher(algorithms.AES(self._key), modes.GCM(nonce, tag)).decryptor()
+            try:
+                with open(partial_path, 'wb') as dst:
+                    self._stream(decryptor, src, dst, size - NONCE_LENGTH - TAG_LENGTH)
+                    decryptor.finalize()
+            except BaseException:
+                if os.path.exists(partial_path):
+                    os.remove(partial_path)
+                raise
+        os.replace(partial_path, output_path)
+
+    @staticmethod
+    def _stream(context, src, dst, length: int):
+        """Feed length bytes from src through a cipher context into dst"""
+        in_buffer = bytearray(FILE_CHUNK_SIZE)
+        out_buffer = bytearray(FILE_CHUNK_SIZE + 15)  # update_into needs block_size - 1 spare bytes
+        in_view = memoryview(in_buffer)
+        out_view = memoryview(out_buffer)
+        remaining = length
+        try:
+            while remaining > 0:
+                read = src.readinto(in_view[:min(remaining, FILE_CHUNK_SIZE)])
+                if not read:
+                    raise ValueError("Unexpected end of file while streaming cipher data")
+                remaining -= read
+                written = context.update_into(in_view[:read], out_buffer)
+                dst.write(out_view[:written])
+        finally:
+            # One side of the cipher always holds plaintext
+            in_buffer[:] = bytes(len(in_buffer))
+            out_buffer[:] = bytes(len(out_buffer))
\ No newline at end of file
@@ -1,7 +1,15 @@
 import re
 import os
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Union
+from typing import List, Tuple, Union
+
+# google-re2 guarantees linear-time matching; fall back to the stdlib engine
+try:
+    import re2 as pattern_engine
+except ImportError:
+    pattern_engine = re
 
 class SecurityError(Exception):
     """Security-related error"""
@@ -11,8 +19,8 @@ class SecurityValidator:
     """Comprehensive input validation for Aura services"""
 
     # Secure patterns for different input types
-    SAFE_FILENAME_PATTERN = re.compile(r'^[a-zA-Z0-9._-]+$')
-    SAFE_PATH_PATTERN = re.compile(r'^[a-zA-Z0-9/._-]+$')
+    SAFE_FILENAME_PATTERN = pattern_engine.compile(r'^[a-zA-Z0-9._-]+$')
+    SAFE_PATH_PATTERN = pattern_engine.compile(r'^[a-zA-Z0-9/._-]+$')
     CODE_INJECTION_PATTERNS = [
         r'eval\s*\(',
         r'exec\s*\(',
@@ -20,6 +28,21 @@ class SecurityValidator:
         r'subprocess\.',
         r'os\.system',
     ]
+    # All injection patterns folded into one case-insensitive pass
+    # (inline (?i) because re2 does not accept re module flags)
+    CODE_INJECTION_REGEX = pattern_engine.compile(
+        '(?i)' + '|'.join(f'({pattern})' for pattern in CODE_INJECTION_PATTERNS)
+    )
+    PROMPT_INJECTION_PHRASES = [
+        "ignore previous instructions",
+        "system:",
+        "assistant:",
+        "jailbreak",
+        "override safety"
+    ]
+    PROMPT_INJECTION_REGEX = pattern_engine.compile(
+        '(?i)' + '|'.join(re.escape(phrase) for phrase in PROMPT_INJECTION_PHRASES)
+    )
 
     @staticmethod
     def validate_file_path(file_path: str, allowed_dirs: List[str] = None) -> str:
@@ -31,10 +54,10 @@ class SecurityValidator:
 
         # Validate against allowed directories if provided
         if allowed_dirs:
-            resolved_path = Path(normalized).resolve()
+            resolved_path = str(Path(normalized).resolve())
             allowed = any(
-                str(resolved_path).startswith(str(Path(d).resolve()))
-                for d in allowed_dirs
+                _is_within(resolved_path, allowed_dir)
+                for allowed_dir in _resolve_allowed_dirs(os.getcwd(), tuple(allowed_dirs))
             )
             if not allowed:
                 raise SecurityError("Access to path not permitted")
@@ -46,9 +69,24 @@ class SecurityValidator:
         if len(code) > max_length:
             raise SecurityError("Code input exceeds maximum length")
 
-        for pattern in SecurityValidator.CODE_INJECTION_PATTERNS:
-            if re.search(pattern, code, re.IGNORECASE):
+        database = _injection_database()
+        if database is not None:
+            matched_ids = []
+
+            def on_match(pattern_id, start, end, flags, context):
+                matched_ids.append(pattern_id)
+
+            database.scan(code.encode('utf-8', 'surrogatepass'), match_event_handler=on_match,
+                          scratch=_injection_scratch(database))
+            if matched_ids:
+                pattern = SecurityValidator.CODE_INJECTION_PATTERNS[min(matched_ids)]
                 raise SecurityError(f"Potentially dangerous code pattern detected: {pattern}")
+            return code
+
+        match = SecurityValidator.CODE_INJECTION_REGEX.search(code)
+        if match:
+            pattern = SecurityValidator.CODE_INJECTION_PATTERNS[match.lastindex - 1]
+            raise SecurityError(f"Potentially dangerous code pattern detected: {pattern}")
         return code
 
     @staticmethod
@@ -57,17 +95,13 @@ class SecurityValidator:
         if len(prompt) > max_length:
             raise SecurityError("Prompt exceeds maximum length")
 
-        dangerous_phrases = [
-            "ignore previous instructions",
-            "system:",
-            "assistant:",
-            "jailbreak",
-            "override safety"
-        ]
-        lower_prompt = prompt.lower()
-        for phrase in dangerous_phrases:
-            if phrase in lower_prompt:
-                raise SecurityError("Potential prompt injection detected")
+        automaton = _prompt_automaton()
+        if automaton is not None:
+            detected = next(automaton.iter(prompt.lower()), None) is not None
+        else:
+            detected = SecurityValidator.PROMPT_INJECTION_REGEX.search(prompt) is not None
+        if detected:
+            raise SecurityError("Potential prompt injection detected")
         return prompt
 
     def validate_input(self, data: str, input_type: str = 'general') -> bool:
@@ -84,6 +118,73 @@ class SecurityValidator:
             return False
 
 
+@lru_cache(maxsize=64)
+def _resolve_allowed_dirs(cwd: str, allowed_dirs: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Resolve allowed directories once per list and working directory rather than per call"""
+    return tuple(str(Path(d).resolve()) for d in allowed_dirs)
+
+
+def _is_within(path: str, directory: str) -> bool:
+    """True if path is directory itself or lies beneath it"""
+    try:
+        return os.path.commonpath([path, directory]) == directory
+    except ValueError:  # e.g. different drives on Windows
+        return False
+
+
+@lru_cache(maxsize=1)
+def _injection_database():
+    """Hyperscan database for the code injection patterns, built on first use
+
+    Returns None when hyperscan is not installed, in which case the compiled
+    regex is used instead.
+    """
+    try:
+        import hyperscan
+    except ImportError:
+        return None
+    patterns = SecurityValidator.CODE_INJECTION_PATTERNS
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[pattern.encode() for pattern in patterns],
+        ids=list(range(len(patterns))),
+        elements=len(patterns),
+        flags=hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+    )
+    return database
+
+
+# Hyperscan scratch space may only be used by one scan at a time, so each
+# thread scanning the shared database gets its own
+_scratch_local = threading.local()
+
+
+def _injection_scratch(database):
+    """This thread's scratch space for scanning the injection database"""
+    scratch = getattr(_scratch_local, 'scratch', None)
+    if scratch is None:
+        import hyperscan
+        scratch = _scratch_local.scratch = hyperscan.Scratch(database)
+    return scratch
+
+
+@lru_cache(maxsize=1)
+def _prompt_automaton():
+    """Aho-Corasick automaton for the prompt injection phrases, built on first use
+
+    Returns None when pyahocorasick is not installed.
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+    automaton = ahocorasick.Automaton()
+    for phrase in SecurityValidator.PROMPT_INJECTION_PHRASES:
+        automaton.add_word(phrase, phrase)
+    automaton.make_automaton()
+    return automaton
+
+
 def validate_code_input(code: str, max_length: int = 100000) -> str:
     """Convenience function for code validation"""
     return SecurityValidator.sanitize_code_input(code, max_length)
\ No newline at end of file
@@ -1,67 +1,108 @@
 import ssl
 import certifi
 import httpx
+from functools import lru_cache
 from typing import Dict, Any
 from urllib.parse import urlparse
 
+# Read size used while streaming response bodies
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Headers describing the wire body, which no longer apply once it is decoded
+WIRE_BODY_HEADERS = frozenset({'content-encoding', 'content-length', 'transfer-encoding'})
+
 class SecurityError(Exception):
     """Security-related error"""
     pass
 
+@lru_cache(maxsize=1)
+def _default_ssl_context() -> ssl.SSLContext:
+    """Strict TLS context; the CA bundle is parsed once per process"""
+    context = ssl.create_default_context(cafile=certifi.where())
+    context.check_hostname = True
+    context.verify_mode = ssl.CERT_REQUIRED
+    context.minimum_version = ssl.TLSVersion.TLSv1_2
+    return context
+
 class SecureHTTPClient:
     """Secure HTTP client with proper TLS validation"""
 
+    ALLOWED_CONTENT_TYPES = frozenset({'application/json', 'text/plain', 'application/xml'})
+
+    DEFAULT_HEADERS = {
+        'User-Agent': 'Aura/2.0 Security-Enhanced',
+        'Accept': 'application/json',
+    }
+
     def __init__(self, config: Dict[str, Any]):
         self.timeout = config.get('timeout', 30)
         self.verify_ssl = config.get('verify_ssl', True)
-        self.allowed_hosts = config.get('allowed_hosts', [])
+        self.allowed_hosts = frozenset(host.lower() for host in config.get('allowed_hosts', []))
+        self.max_response_size = config.get('max_response_size', 10 * 1024 * 1024)
 
         # Create SSL context with strong security
-        self.ssl_context = ssl.create_default_context(cafile=certifi.where())
-        self.ssl_context.check_hostname = True
-        self.ssl_context.verify_mode = ssl.CERT_REQUIRED
-        self.ssl_context.minimum_version = ssl.TLSVersion.TLSv1_2
+        self.ssl_context = _default_ssl_context()
+
+        # One pooled client for the lifetime of this object, so connections
+        # (and their TLS sessions) are reused across requests. verify_ssl=False
+        # only skips the strict context; httpx's default verification still applies
+        self._client = httpx.AsyncClient(
+            verify=self.ssl_context if self.verify_ssl else True,
+            timeout=self.timeout,
+            headers=self.DEFAULT_HEADERS
+        )
 
     async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
         """Make secure HTTP request with validation"""
         if not self._is_url_allowed(url):
             raise SecurityError(f"Access to URL not permitted: {url}")
 
-        # Set security headers
+        # Security headers always win over caller-supplied ones
         headers = kwargs.get('headers', {})
-        headers.update({
-            'User-Agent': 'Aura/2.0 Security-Enhanced',
-            'Accept': 'application/json',
-            'Connection': 'close'
-        })
+        headers.update(self.DEFAULT_HEADERS)
         kwargs['headers'] = headers
 
-        # Configure SSL verification
-        if self.verify_ssl:
-            kwargs['verify'] = self.ssl_context
-
-        # Set timeout
-        kwargs['timeout'] = self.timeout
-
-        async with httpx.AsyncClient() as client:
-            response = await client.request(method, url, **kwargs)
+        # Validate headers before any of the body is read, then enforce the
+        # size limit while streaming so oversized bodies are never buffered
+        async with self._client.stream(method, url, **kwargs) as response:
             self._validate_response(response)
-            return response
+            body = bytearray()
+            async for chunk in response.aiter_bytes(chunk_size=STREAM_CHUNK_SIZE):
+                body += chunk
+                if len(body) > self.max_response_size:
+                    raise SecurityError("Response size exceeds limit")
+            # Hand back a fully read response carrying the already-decoded body
+            headers = [
+                (name, value) for name, value in response.headers.multi_items()
+                if name.lower() not in WIRE_BODY_HEADERS
+            ]
+            return httpx.Response(
+                response.status_code,
+                headers=headers,
+                content=bytes(body),
+                request=response.request,
+                extensions=response.extensions,
+                history=response.history,
+            )
+
+    async def aclose(self):
+        """Close pooled connections"""
+        await self._client.aclose()
 
     def _is_url_allowed(self, url: str) -> bool:
         """Check if URL is in allowed hosts list"""
         if not self.allowed_hosts:
             return True  # No restrictions if list is empty
-        parsed = urlparse(url)
-        return parsed.hostname in self.allowed_hosts
+        # urlparse already lower-cases hostname
+        return urlparse(url).hostname in self.allowed_hosts
 
     def _validate_response(self, response: httpx.Response):
         """Validate HTTP response for security"""
         content_length = response.headers.get('content-length')
-        if content_length and int(content_length) > 10 * 1024 * 1024:  # 10MB limit
+        if content_length and int(content_length) > self.max_response_size:
             raise SecurityError("Response size exceeds limit")
 
         content_type = response.headers.get('content-type', '')
-        allowed_types = ['application/json', 'text/plain', 'application/xml']
-        if not any(allowed in content_type for allowed in allowed_types):
+        media_type = content_type.split(';', 1)[0].strip().lower()
+        if media_type not in self.ALLOWED_CONTENT_TYPES:
             raise SecurityError(f"Disallowed content type: {content_type}")
\ No newline at end of file
@@ -1,12 +1,15 @@
 import asyncio
 import time
 import logging
-from collections import defaultdict
+from collections import defaultdict, deque
 from typing import Dict, Optional
 import psutil
 
 logger = logging.getLogger(__name__)
 
+# Sliding rate-limit window, in monotonic nanoseconds
+RATE_LIMIT_WINDOW_NS = 60_000_000_000
+
 class ResourceError(Exception):
     """Resource-related error"""
     pass
@@ -21,9 +24,14 @@ class ResourceManager:
         self.rate_limits = config.get('rate_limits', {})
 
         self._active_analyses = 0
-        self._rate_limit_counters = defaultdict(list)
+        self._rate_limit_counters = defaultdict(deque)
         self._memory_monitor_task = None
 
+        # Latest resource sample; cpu_percent(interval=None) measures since
+        # the previous call, so this first call primes the delta
+        self._last_cpu = psutil.cpu_percent(interval=None)
+        self._last_memory = psutil.virtual_memory().percent
+
     async def start_monitoring(self):
         """Start resource monitoring"""
         self._memory_monitor_task = asyncio.create_task(self._monitor_resources())
@@ -32,6 +40,7 @@ class ResourceManager:
         """Stop resource monitoring"""
         if self._memory_monitor_task:
             self._memory_monitor_task.cancel()
+            self._memory_monitor_task = None
 
     async def acquire_analysis_slot(self, client_id: str) -> bool:
         """Acquire a slot for code analysis with rate limiting"""
@@ -43,9 +52,11 @@ class ResourceManager:
         if not self._check_rate_limit(client_id, 'analysis'):
             raise ResourceError("Rate limit exceeded for analysis requests")
 
-        # Check system resources
-        memory_percent = psutil.virtual_memory().percent
-        cpu_percent = psutil.cpu_percent(interval=1)
+        # Check system resources (sampled by the monitor task when it runs)
+        if self._memory_monitor_task is None:
+            self._sample_resources()
+        memory_percent = self._last_memory
+        cpu_percent = self._last_cpu
 
         if memory_percent > self.max_memory_mb:
             raise ResourceError("System memory usage too high")
@@ -63,29 +74,35 @@ class ResourceManager:
     def _check_rate_limit(self, client_id: str, operation: str) -> bool:
         """Check if operation is within rate limits"""
         limit_key = f"{client_id}:{operation}"
-        current_time = time.time()
+        current_time = time.monotonic_ns()
+        timestamps = self._rate_limit_counters[limit_key]
 
-        # Clean old entries
-        self._rate_limit_counters[limit_key] = [
-            timestamp for timestamp in self._rate_limit_counters[limit_key]
-            if current_time - timestamp < 60  # 1-minute window
-        ]
+        # Drop entries that fell out of the 1-minute window (oldest first)
+        cutoff = current_time - RATE_LIMIT_WINDOW_NS
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
 
         # Check limit
         limit = self.rate_limits.get(operation, 100)  # Default 100 per minute
-        if len(self._rate_limit_counters[limit_key]) >= limit:
+        if len(timestamps) >= limit:
             return False
 
         # Record this request
-        self._rate_limit_counters[limit_key].append(current_time)
+        timestamps.append(current_time)
         return True
 
+    def _sample_resources(self):
+        """Refresh the cached CPU and memory readings without blocking"""
+        self._last_cpu = psutil.cpu_percent(interval=None)
+        self._last_memory = psutil.virtual_memory().percent
+
     async def _monitor_resources(self):
         """Continuously monitor system resources"""
         while True:
             try:
-                memory_percent = psutil.virtual_memory().percent
-                cpu_percent = psutil.cpu_percent(interval=1)
+                self._sample_resources()
+                memory_percent = self._last_memory
+                cpu_percent = self._last_cpu
 
                 # Log warnings for high usage
                 if memory_percent > 90:
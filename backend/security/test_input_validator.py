@@ -0,0 +1,39 @@
+"""
+Tests for SecurityValidator - concurrent use of the shared pattern matchers
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add the backend directory to the path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from security.input_validator import SecurityError, SecurityValidator
+
+
+def _check(code: str) -> bool:
+    """True if the code passed validation, False if it was rejected"""
+    try:
+        SecurityValidator.sanitize_code_input(code)
+        return True
+    except SecurityError:
+        return False
+
+
+def test_sanitize_code_input_threaded():
+    """Concurrent scans must neither fail nor mix up results between threads"""
+    # Inputs near the size limit keep each scan running long enough to overlap
+    safe = "def add(a, b):\n    return a + b\n" * 3000
+    dangerous = safe + "eval(user_input)\n"
+    inputs = [safe, dangerous] * 256
+
+    with ThreadPoolExecutor(max_workers=64) as executor:
+        results = list(executor.map(_check, inputs))
+
+    assert results == [True, False] * 256
+
+
+if __name__ == "__main__":
+    test_sanitize_code_input_threaded()
+    print("✅ SecurityValidator threaded scan test passed")
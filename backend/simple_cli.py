@@ -9,6 +9,7 @@ Author: Aura - Level 9 Autonomous AI Coding Assistant
 """
 
 import asyncio
+import os
 import sys
 import json
 from pathlib import Path
@@ -16,6 +17,24 @@ import click
 from quick_demo import AuraDemo
 
 
+def _count_python_files(root: str) -> int:
+    """Count .py files under root using cached dirent types (no per-file stat)"""
+    count = 0
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.py'):
+                    count += 1
+    return count
+
+
 @click.group()
 def cli():
     """Aura - Level 9 Autonomous AI Coding Assistant CLI"""
@@ -122,8 +141,7 @@ def status():
         
         # Quick codebase scan
         print(f"\n📊 Quick Codebase Scan:")
-        python_files = list(Path('.').rglob("*.py"))
-        print(f"🐍 Python files: {len(python_files)}")
+        print(f"🐍 Python files: {_count_python_files('.')}")
         
     asyncio.run(check_status())
 
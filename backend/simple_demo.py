@@ -22,22 +22,21 @@ from performance.standalone_manager import StandalonePerformanceManager
 async def simple_file_analyzer(file_path: str):
     """Simple file analysis function for demonstration"""
     try:
-        with open(file_path, 'r') as f:
-            content = f.read()
+        start_time = time.perf_counter()
+        
+        # Read in the default thread pool so several files overlap on disk IO
+        content = await asyncio.to_thread(Path(file_path).read_text)
         
         # Simple metrics
         lines = len(content.splitlines())
         chars = len(content)
         
-        # Simulate some processing time
-        await asyncio.sleep(0.1)
-        
         return {
             'file': file_path,
             'lines': lines,
             'characters': chars,
             'size_kb': chars / 1024,
-            'analysis_time': 0.1
+            'analysis_time': time.perf_counter() - start_time
         }
     except Exception as e:
         return {'file': file_path, 'error': str(e)}
@@ -68,17 +67,16 @@ async def demo_performance():
     python_files = [str(f) for f in Path('.').rglob("*.py")][:5]  # Limit for demo
     print(f"🔍 Found {len(python_files)} files for analysis")
     
-    # Test 1: Sequential processing
-    print("\n📊 Sequential processing...")
+    # Test 1: Baseline (plain asyncio.gather, no performance manager)
+    print("\n📊 Baseline processing (asyncio.gather)...")
     start_time = time.time()
     
-    sequential_results = []
-    for file_path in python_files:
-        result = await simple_file_analyzer(file_path)
-        sequential_results.append(result)
+    baseline_results = await asyncio.gather(
+        *(simple_file_analyzer(file_path) for file_path in python_files)
+    )
     
-    sequential_time = time.time() - start_time
-    print(f"⏱️ Sequential time: {sequential_time:.2f} seconds")
+    baseline_time = time.time() - start_time
+    print(f"⏱️ Baseline time: {baseline_time:.2f} seconds")
     
     # Set baseline
     await perf_manager.set_baseline_metrics()
@@ -96,7 +94,7 @@ async def demo_performance():
     print(f"⏱️ Parallel time: {parallel_time:.2f} seconds")
     
     # Calculate speedup
-    speedup = sequential_time / parallel_time if parallel_time > 0 else 1
+    speedup = baseline_time / parallel_time if parallel_time > 0 else 1
     print(f"🎯 Speedup: {speedup:.2f}x faster")
     
     # Show performance report
@@ -9,6 +9,7 @@ Author: Aura - Level 9 Autonomous AI Coding Assistant
 """
 
 import asyncio
+import signal
 import sys
 import os
 from pathlib import Path
@@ -75,10 +76,18 @@ async def start_aura():
         print("  python quick_demo.py  # For a comprehensive demo")
         print("  python start_aura.py  # This launcher")
         
-        # Keep running
+        # Keep running until a shutdown signal arrives (no periodic wakeups)
         print("\n⏳ Aura is now running. Press Ctrl+C to stop.")
-        while True:
-            await asyncio.sleep(1)
+        shutdown = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, shutdown.set)
+            except (NotImplementedError, RuntimeError):
+                pass  # Windows: Ctrl+C still raises KeyboardInterrupt
+        await shutdown.wait()
+        print("\n👋 Shutting down Aura system...")
+        return True
             
     except KeyboardInterrupt:
         print("\n👋 Shutting down Aura system...")
@@ -12,81 +12,209 @@ Phase: VS Code Integration
 """
 
 import zmq
-import json
 import threading
 import time
 import logging
 import sys
 import os
-from typing import Dict, Any, Optional, List
+import importlib
+import ast
+import hashlib
+import stat
+import re
+from collections import OrderedDict
+from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
+from vscode_protocol import DEFAULT_IPC_PATH, json_dumps, json_loads
+
+# With msgspec, requests decode straight from the frame into a typed struct
+# and anything that is not a {"target": str, "payload": {...}} object is
+# rejected in the same pass
+try:
+    import msgspec
+
+    class Request(msgspec.Struct):
+        """Wire shape of a request from the VS Code extension"""
+        target: str = 'unknown'
+        payload: Dict[str, Any] = {}
+
+    _request_decoder = msgspec.json.Decoder(Request)
+
+    def _decode_request(data) -> tuple:
+        """Decode a request frame into (target, command, payload)"""
+        request = _request_decoder.decode(data)
+        return request.target, request.payload.get('command', 'unknown'), request.payload
+except ImportError:
+    def _decode_request(data) -> tuple:
+        """Decode a request frame into (target, command, payload)"""
+        message = json_loads(data)
+        payload = message.get('payload', {})
+        return message.get('target', 'unknown'), payload.get('command', 'unknown'), payload
+
+# I/O threads for the process-wide zmq context, and the per-socket queue
+# depth so bursts from the extension are buffered rather than dropped
+ZMQ_IO_THREADS = 2
+SOCKET_HWM = 10000
+
+# Unix-domain endpoint for an extension running on the same machine
+DEFAULT_IPC_ENDPOINT = f"ipc://{DEFAULT_IPC_PATH}" if DEFAULT_IPC_PATH else None
+
+# Upper bound on worker replies forwarded per poller wakeup
+REPLY_BATCH_SIZE = 32
+
+# Seconds between module health checks, run from the service loop's poll timeout
+HEALTH_CHECK_INTERVAL = 30.0
+
+# Read-only requests the extension repeats constantly (focus change, save)
+# and how many seconds a successful reply stays fresh. get_status is left out
+# because its payload holds live references to the service's counters
+RESPONSE_CACHE_TTLS = {
+    ('python_intelligence', 'analyze_file'): 30.0,
+}
+RESPONSE_CACHE_SIZE = 256
+
+# Concurrent executions allowed per command. Analyses are read-only and run
+# widely in parallel, commits touch the git index and run one at a time, and
+# LLM calls are capped so a flood cannot exhaust the model server. Requests
+# over the limit get a "busy" reply instead of tying up a worker.
+COMMAND_CONCURRENCY = {
+    ('python_intelligence', 'analyze_file'): 8,
+    ('llm_provider', 'generate'): 2,
+    ('git_semantic', 'generate_commit'): 1,
+}
+
+# Analyses kept for files the extension analyzes repeatedly
+ANALYSIS_CACHE_SIZE = 64
+
+# Largest source analyze_file will read; anything bigger is rejected unread
+MAX_ANALYZE_BYTES = 2 * 1024 * 1024
+
+# Lines whose first non-blank character is not a comment marker
+CODE_LINE_PATTERN = re.compile(rb'(?m)^[ \t\f\v\r]*[^\s#]')
+
+# health_check is polled continuously, so its reply is spliced into a
+# pre-encoded template instead of going through the JSON encoder
+HEALTH_REPLY_TEMPLATE = (
+    b'{"success":true,"type":"response","payload":{"status":"healthy",'
+    b'"modules_loaded":%d,"uptime":%s,"requests_processed":%d}}'
+)
+
 # Add backend modules to path
 backend_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, backend_dir)
 
-# Import basic Python analysis modules
-import ast
-import subprocess
-
-# Try to import Aura modules with better error handling
-aura_modules_available = {
-    'python_analyzer': False,
-    'llm_provider': False,
-    'git_semantic': False,
-    'test_generator': False,
-    'refactoring_engine': False
+# Aura modules are imported on the first request that needs them rather than
+# at start-up, so the service answers sooner and unused features cost nothing.
+# module name -> (backend subdirectory, python module, class name)
+MODULE_SPECS = {
+    'python_intelligence': ('intelligence', 'python_analyzer', 'PythonAnalyzer'),
+    'llm_provider': ('llm', 'providers', 'LLMProviderManager'),
+    'git_semantic': ('git', 'semantic_commits', 'SemanticCommitGenerator'),
+    'test_generator': ('generation', 'test_generator', 'TestGenerator'),
+    'refactoring_engine': ('generation', 'refactoring_engine', 'RefactoringEngine'),
 }
 
-print("Loading Aura modules...")
-try:
-    # Try importing with absolute path
-    sys.path.insert(0, os.path.join(backend_dir, 'intelligence'))
-    from python_analyzer import PythonAnalyzer
-    aura_modules_available['python_analyzer'] = True
-    print("✅ Python analyzer loaded")
-except ImportError as e:
-    print(f"⚠️  Python analyzer not available: {e}")
+# None until an import has been attempted, then whether it succeeded
+aura_modules_available: Dict[str, Optional[bool]] = dict.fromkeys(MODULE_SPECS)
 
-try:
-    sys.path.insert(0, os.path.join(backend_dir, 'llm'))
-    from providers import LLMProviderManager
-    aura_modules_available['llm_provider'] = True
-    print("✅ LLM provider loaded")
-except ImportError as e:
-    print(f"⚠️  LLM provider not available: {e}")
+_module_search_paths = set()
 
-try:
-    sys.path.insert(0, os.path.join(backend_dir, 'git'))
-    from semantic_commits import SemanticCommitGenerator
-    aura_modules_available['git_semantic'] = True
-    print("✅ Git semantic commits loaded")
-except ImportError as e:
-    print(f"⚠️  Git semantic commits not available: {e}")
 
-try:
-    sys.path.insert(0, os.path.join(backend_dir, 'generation'))
-    from test_generator import TestGenerator
-    from refactoring_engine import RefactoringEngine
-    aura_modules_available['test_generator'] = True
-    aura_modules_available['refactoring_engine'] = True
-    print("✅ Code generation modules loaded")
-except ImportError as e:
-    print(f"⚠️  Code generation modules not available: {e}")
+def _import_module_attr(module_name: str, attr: str) -> Any:
+    """Import a name from an Aura module's python module, adding its directory to sys.path once"""
+    subdir, python_module, _ = MODULE_SPECS[module_name]
+    if subdir not in _module_search_paths:
+        sys.path.insert(0, os.path.join(backend_dir, subdir))
+        _module_search_paths.add(subdir)
+    return getattr(importlib.import_module(python_module), attr)
+
+
+def _import_module_class(module_name: str) -> type:
+    """Import the class backing an Aura module"""
+    return _import_module_attr(module_name, MODULE_SPECS[module_name][2])
+
+
+@lru_cache(maxsize=1)
+def _python_ast_visitor() -> Optional[type]:
+    """The Python analyzer's AST visitor, or None when the analyzer cannot be imported"""
+    try:
+        return _import_module_attr('python_intelligence', 'PythonASTVisitor')
+    except Exception as e:
+        logging.getLogger('AuraVSCodeService').warning("Python analyzer not available: %s", e)
+        return None
+
+
+def _read_source(file_path: str) -> bytes:
+    """Read a regular file of at most MAX_ANALYZE_BYTES without blocking on devices or FIFOs"""
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_NONBLOCK', 0))
+    with os.fdopen(fd, 'rb') as f:
+        if not stat.S_ISREG(os.fstat(fd).st_mode):
+            raise ValueError("file_path is not a regular file")
+        source = f.read(MAX_ANALYZE_BYTES + 1)
+    if len(source) > MAX_ANALYZE_BYTES:
+        raise ValueError(f"File exceeds {MAX_ANALYZE_BYTES} bytes")
+    return source
+
+def _ok_response(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Successful reply envelope"""
+    return {"success": True, "type": "response", "payload": payload}
+
+
+def _error_response(error_type: str, message: str) -> Dict[str, Any]:
+    """Failed reply envelope"""
+    return {"success": False, "error": message, "type": error_type, "payload": {}}
+
+
+@lru_cache(maxsize=256)
+def _encode_error(error_type: str, message: str) -> bytes:
+    """Encoded error reply, memoized for clients that repeat the same bad request"""
+    return json_dumps(_error_response(error_type, message))
 
-print(f"Modules loaded: {sum(aura_modules_available.values())}/5")
 
 class VSCodeBackendService:
     """
     ZeroMQ service bridge between VS Code extension and Aura backend modules.
-    Provides REQ/REP pattern communication for VS Code integration.
+    Serves REQ clients from a ROUTER socket so slow requests (LLM calls) run
+    on a worker pool without holding up health checks and analyses.
     """
     
-    def __init__(self, port: int = 5559):
-        self.context = zmq.Context()
-        self.socket = self.context.socket(zmq.REP)
+    def __init__(self, port: int = 5559, max_workers: int = 8, endpoint: Optional[str] = None):
+        # Shared with any other sockets in this process (see shutdown)
+        self.context = zmq.Context.instance(io_threads=ZMQ_IO_THREADS)
+        self.socket = self.context.socket(zmq.ROUTER)
+        self.socket.setsockopt(zmq.LINGER, 0)
+        self.socket.setsockopt(zmq.RCVHWM, SOCKET_HWM)
+        self.socket.setsockopt(zmq.SNDHWM, SOCKET_HWM)
         self.port = port
+        self.endpoint = endpoint or f"tcp://*:{port}"
         self.running = False
+
+        # Workers hand finished replies to the I/O thread over inproc PUSH/PULL,
+        # since only the thread that polls the ROUTER socket may send on it
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix='aura-vscode')
+        self._reply_endpoint = f"inproc://aura-vscode-replies-{id(self)}"
+        self._reply_sock = self.context.socket(zmq.PULL)
+        self._reply_sock.bind(self._reply_endpoint)
+        self._worker_local = threading.local()
+        self._worker_socks: List[zmq.Socket] = []
+        self._worker_socks_lock = threading.Lock()
+
+        # Inproc pair used by stop() to wake the poller without a timeout
+        wake_endpoint = f"inproc://aura-vscode-wake-{id(self)}"
+        self._wake_sock = self.context.socket(zmq.PAIR)
+        self._wake_sock.bind(wake_endpoint)
+        self._stop_sock = self.context.socket(zmq.PAIR)
+        self._stop_sock.connect(wake_endpoint)
+
+        self._poller = zmq.Poller()
+        self._poller.register(self.socket, zmq.POLLIN)
+        self._poller.register(self._wake_sock, zmq.POLLIN)
+        self._poller.register(self._reply_sock, zmq.POLLIN)
         
         # Setup logging
         self.logger = self._setup_logging()
@@ -94,6 +222,42 @@ class VSCodeBackendService:
         # Aura module instances - lazy loaded for performance
         self._modules: Dict[str, Any] = {}
         self._module_health: Dict[str, bool] = {}
+        self._module_lock = threading.Lock()
+        
+        # LRU of recent replies to cacheable requests: key -> (expires, response)
+        self._response_cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # Cacheable requests currently being computed: key -> envelopes of
+        # identical requests waiting on that result
+        self._inflight: Dict[tuple, List[List[zmq.Frame]]] = {}
+        self._inflight_lock = threading.Lock()
+        
+        self._command_slots = {
+            key: threading.BoundedSemaphore(limit) for key, limit in COMMAND_CONCURRENCY.items()
+        }
+        
+        # LRU of analyses: (path, mtime_ns, size) or content digest -> (elements, metrics)
+        self._analysis_cache: OrderedDict = OrderedDict()
+        self._analysis_lock = threading.Lock()
+        
+        # Request routing tables, bound once instead of an if/elif chain per request
+        self._target_handlers = {
+            'system': self._handle_system_request,
+            'python_intelligence': self._handle_python_analysis,
+            'llm_provider': self._handle_llm_request,
+            'git_semantic': self._handle_git_request,
+            'test_generator': self._handle_test_generation,
+            'refactoring_engine': self._handle_refactoring,
+        }
+        self._system_commands = {
+            'health_check': self._system_health_check,
+            'get_status': self._system_get_status,
+        }
+        self._llm_commands = {
+            'generate': self._llm_generate,
+            'health_check': self._llm_health_check,
+        }
         
         # Service statistics
         self.stats = {
@@ -102,6 +266,10 @@ class VSCodeBackendService:
             'start_time': time.time(),
             'modules_loaded': 0
         }
+        # Workers and the I/O thread update counters concurrently
+        self._stats_lock = threading.Lock()
+        # Uptime comes from the monotonic clock: cheaper, and immune to wall-clock jumps
+        self._start_ns = time.monotonic_ns()
         
     def _setup_logging(self) -> logging.Logger:
         """Setup logging for the service"""
@@ -123,309 +291,427 @@ class VSCodeBackendService:
         if module_name in self._modules:
             return self._modules[module_name]
             
+        with self._module_lock:
+            if module_name in self._modules:
+                return self._modules[module_name]
+            return self._load_module(module_name)
+            
+    def _load_module(self, module_name: str) -> Optional[Any]:
+        """Instantiate an Aura module; caller holds _module_lock"""
+        if module_name not in MODULE_SPECS or aura_modules_available[module_name] is False:
+            return None
+            
         try:
-            if module_name == 'python_intelligence' and aura_modules_available['python_analyzer']:
-                module = PythonAnalyzer()
-                self._modules[module_name] = module
-                self._module_health[module_name] = True
-                self.stats['modules_loaded'] += 1
-                self.logger.info(f"Loaded module: {module_name}")
-                return module
-                
-            elif module_name == 'llm_provider' and aura_modules_available['llm_provider']:
-                module = LLMProviderManager()
-                self._modules[module_name] = module
-                self._module_health[module_name] = True
-                self.stats['modules_loaded'] += 1
-                self.logger.info(f"Loaded module: {module_name}")
-                return module
-                
-            elif module_name == 'git_semantic' and aura_modules_available['git_semantic']:
-                module = SemanticCommitGenerator()
-                self._modules[module_name] = module
-                self._module_health[module_name] = True
-                self.stats['modules_loaded'] += 1
-                self.logger.info(f"Loaded module: {module_name}")
-                return module
-                
-            elif module_name == 'test_generator' and aura_modules_available['test_generator']:
-                module = TestGenerator()
-                self._modules[module_name] = module
-                self._module_health[module_name] = True
-                self.stats['modules_loaded'] += 1
-                self.logger.info(f"Loaded module: {module_name}")
-                return module
-                
-            elif module_name == 'refactoring_engine' and aura_modules_available['refactoring_engine']:
-                module = RefactoringEngine()
-                self._modules[module_name] = module
-                self._module_health[module_name] = True
-                self.stats['modules_loaded'] += 1
-                self.logger.info(f"Loaded module: {module_name}")
-                return module
+            module_class = _import_module_class(module_name)
+        except (ImportError, AttributeError) as e:
+            aura_modules_available[module_name] = False
+            self.logger.warning("Module %s not available: %s", module_name, e)
+            return None
+        aura_modules_available[module_name] = True
+            
+        try:
+            module = module_class()
+            self._modules[module_name] = module
+            self._module_health[module_name] = True
+            self._count('modules_loaded')
+            self.logger.info("Loaded module: %s", module_name)
+            return module
                 
         except Exception as e:
-            self.logger.error(f"Failed to load module {module_name}: {e}")
+            self.logger.error("Failed to load module %s: %s", module_name, e)
             self._module_health[module_name] = False
             
         return None
         
     def start_service(self):
-        """Start the ZeroMQ service on specified port"""
+        """Start the ZeroMQ service on the configured endpoint"""
         try:
-            self.socket.bind(f"tcp://*:{self.port}")
+            self.socket.bind(self.endpoint)
             self.running = True
-            self.logger.info(f"🚀 Aura VS Code Backend Service started on port {self.port}")
+            self.logger.info("🚀 Aura VS Code Backend Service started on %s", self.endpoint)
             
-            # Start health monitoring thread
-            health_thread = threading.Thread(target=self._health_monitor, daemon=True)
-            health_thread.start()
+            # Module health checks are scheduled by the poll timeout below
+            # rather than by a dedicated sleeping thread
+            next_health_check = time.monotonic() + HEALTH_CHECK_INTERVAL
             
-            # Main service loop
+            # Main service loop - blocks in the poller until a request, a
+            # finished reply or a stop() wakeup arrives
             while self.running:
                 try:
-                    # Receive message from VS Code extension
-                    message_raw = self.socket.recv_string(zmq.NOBLOCK)
-                    message = json.loads(message_raw)
-                    
-                    # Process and route to appropriate Aura module
-                    response = self.handle_request(message)
-                    
-                    # Send response back to extension
-                    self.socket.send_json(response)
+                    now = time.monotonic()
+                    if now >= next_health_check:
+                        self._executor.submit(self._check_module_health)
+                        next_health_check = now + HEALTH_CHECK_INTERVAL
+                    timeout = int((next_health_check - now) * 1000) + 1
                     
-                    self.stats['requests_processed'] += 1
-                    
-                except zmq.Again:
-                    # No message available, continue
-                    time.sleep(0.01)
-                    continue
+                    socks = dict(self._poller.poll(timeout=timeout))
+                    if self._wake_sock in socks:
+                        self._wake_sock.recv()
+                        break
+                        
+                    # Send replies finished by the worker pool
+                    if self._reply_sock in socks:
+                        self._flush_replies()
+                        
+                    # Hand new requests from VS Code extension to the worker pool;
+                    # every frame before the body is the routing envelope
+                    if self.socket in socks:
+                        frames = self.socket.recv_multipart(copy=False)
+                        self._executor.submit(self._process, frames[:-1], frames[-1])
                     
                 except KeyboardInterrupt:
                     self.logger.info("Service shutdown requested")
                     break
                     
                 except Exception as e:
-                    self.logger.error(f"Service error: {e}")
-                    self.stats['errors_count'] += 1
-                    
-                    # Send error response if socket is available
-                    try:
-                        error_response = {
-                            "success": False,
-                            "error": str(e),
-                            "type": "service_error",
-                            "payload": {}
-                        }
-                        self.socket.send_json(error_response)
-                    except:
-                        pass
+                    self.logger.error("Service error: %s", e)
+                    self._count('errors_count')
                         
         except Exception as e:
-            self.logger.error(f"Failed to start service: {e}")
+            self.logger.error("Failed to start service: %s", e)
             raise
         finally:
             self.shutdown()
             
+    def _flush_replies(self):
+        """Forward every ready worker reply (up to a batch) in one wakeup"""
+        # Replies arrive already encoded by the workers; pass the frames through
+        # without copying so large payloads cost the I/O thread nothing
+        for _ in range(REPLY_BATCH_SIZE):
+            try:
+                reply = self._reply_sock.recv_multipart(zmq.NOBLOCK, copy=False)
+            except zmq.Again:
+                break
+            self.socket.send_multipart(reply, copy=False)
+            
+    def _process(self, envelope: List[zmq.Frame], body: zmq.Frame):
+        """Worker: decode, handle and encode one request, then queue the reply"""
+        waiters: List[List[zmq.Frame]] = []
+        try:
+            target, command, payload = _decode_request(body.buffer)
+        except (ValueError, AttributeError) as e:
+            self.logger.error("Service error: %s", e)
+            self._count('errors_count')
+            response = _error_response("service_error", str(e))
+        else:
+            if target == 'system' and command == 'health_check':
+                reply = self._health_reply()
+                self._count('requests_processed')
+                self._reply_socket().send_multipart(envelope + [reply])
+                return
+                
+            try:
+                cache_key = self._cache_key(target, command, payload)
+                # A burst of identical requests (save + focus + cursor events)
+                # runs once; the first worker replies to everyone
+                if cache_key is not None and not self._join_inflight(cache_key, envelope):
+                    return
+                try:
+                    response = self._respond(target, command, payload, cache_key)
+                finally:
+                    if cache_key is not None:
+                        waiters = self._finish_inflight(cache_key)
+            except Exception as e:
+                response = self._handler_error(e)
+            self._count('requests_processed', 1 + len(waiters))
+            
+        # Nobody checks this task's future, so a reply that cannot be encoded
+        # must still answer the requester and every waiter
+        try:
+            if response["success"]:
+                reply = json_dumps(response)
+            else:
+                reply = _encode_error(response["type"], response["error"])
+        except Exception as e:
+            self.logger.error("Could not encode response: %s", e)
+            self._count('errors_count')
+            reply = _encode_error("service_error", f"Could not encode response: {e}")
+            
+        # copy=False lets large replies (test suites, LLM text) reach libzmq
+        # without another copy; pyzmq still copies below zmq.COPY_THRESHOLD
+        for recipient in [envelope] + waiters:
+            try:
+                self._reply_socket().send_multipart(recipient + [reply], copy=False)
+            except zmq.ZMQError as e:
+                self.logger.error("Could not queue reply: %s", e)
+                self._count('errors_count')
+            
+    def _count(self, stat: str, amount: int = 1):
+        """Thread-safe increment of a service statistic"""
+        with self._stats_lock:
+            self.stats[stat] += amount
+            
+    def _health_reply(self) -> bytes:
+        """Encoded health_check reply, same content as _handle_system_request"""
+        uptime = (time.monotonic_ns() - self._start_ns) / 1e9
+        return HEALTH_REPLY_TEMPLATE % (self.stats['modules_loaded'], repr(uptime).encode(),
+                                        self.stats['requests_processed'])
+        
+    def _join_inflight(self, key: tuple, envelope: List[zmq.Frame]) -> bool:
+        """Claim a request key; False if it is already running and we will be answered"""
+        with self._inflight_lock:
+            waiters = self._inflight.get(key)
+            if waiters is not None:
+                waiters.append(envelope)
+                return False
+            self._inflight[key] = []
+            return True
+            
+    def _finish_inflight(self, key: tuple) -> List[List[zmq.Frame]]:
+        """Release a request key and return the envelopes that waited on it"""
+        with self._inflight_lock:
+            return self._inflight.pop(key)
+        
+    def _reply_socket(self) -> zmq.Socket:
+        """Per-worker PUSH socket connected to the I/O thread's reply queue"""
+        sock = getattr(self._worker_local, 'socket', None)
+        if sock is None:
+            sock = self.context.socket(zmq.PUSH)
+            sock.connect(self._reply_endpoint)
+            self._worker_local.socket = sock
+            with self._worker_socks_lock:
+                self._worker_socks.append(sock)
+        return sock
+            
     def handle_request(self, message: Dict[str, Any]) -> Dict[str, Any]:
         """Route request to appropriate Aura module"""
         try:
-            target = message.get('target', 'unknown')
-            command = message.get('payload', {}).get('command', 'unknown')
-            payload = message.get('payload', {})
-            
-            self.logger.debug(f"Processing request: {target}.{command}")
+            target, command, payload = self._parse_request(message)
+            return self._respond(target, command, payload,
+                                 self._cache_key(target, command, payload))
+        except Exception as e:
+            return self._handler_error(e)
             
-            # System commands
-            if target == 'system':
-                return self._handle_system_request(command, payload)
-                
-            # Python intelligence commands
-            elif target == 'python_intelligence':
-                return self._handle_python_analysis(command, payload)
-                
-            # LLM provider commands
-            elif target == 'llm_provider':
-                return self._handle_llm_request(command, payload)
-                
-            # Git semantic commands
-            elif target == 'git_semantic':
-                return self._handle_git_request(command, payload)
-                
-            # Test generation commands
-            elif target == 'test_generator':
-                return self._handle_test_generation(command, payload)
-                
-            # Refactoring engine commands
-            elif target == 'refactoring_engine':
-                return self._handle_refactoring(command, payload)
-                
-            else:
-                return {
-                    "success": False,
-                    "error": f"Unknown target: {target}",
-                    "type": "routing_error",
-                    "payload": {}
-                }
+    def _parse_request(self, message: Dict[str, Any]) -> tuple:
+        """Split a request message into (target, command, payload)"""
+        target = message.get('target', 'unknown')
+        command = message.get('payload', {}).get('command', 'unknown')
+        payload = message.get('payload', {})
+        return target, command, payload
+        
+    def _respond(self, target: str, command: str, payload: Dict[str, Any],
+                 cache_key: Optional[tuple]) -> Dict[str, Any]:
+        """Serve a request from the response cache or its handler"""
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Processing request: %s.%s", target, command)
+        
+        if cache_key is not None:
+            cached = self._cached_response(cache_key)
+            if cached is not None:
+                return cached
+                
+        slots = self._command_slots.get((target, command))
+        if slots is None:
+            response = self._route(target, command, payload)
+        elif not slots.acquire(blocking=False):
+            return _error_response("busy", f"Too many concurrent {target}.{command} requests, retry shortly")
+        else:
+            try:
+                response = self._route(target, command, payload)
+            finally:
+                slots.release()
                 
-        except Exception as e:
-            self.logger.error(f"Request handling error: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "type": "handler_error",
-                "payload": {}
-            }
+        if cache_key is not None and response.get('success'):
+            self._cache_response(cache_key, response)
+        return response
+        
+    def _handler_error(self, e: Exception) -> Dict[str, Any]:
+        """Response for an exception raised while handling a request"""
+        self.logger.error("Request handling error: %s", e)
+        return _error_response("handler_error", str(e))
+            
+    def _route(self, target: str, command: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Dispatch a request to the handler for its target"""
+        handler = self._target_handlers.get(target)
+        if handler is None:
+            return _error_response("routing_error", f"Unknown target: {target}")
+        return handler(command, payload)
+            
+    def _cache_key(self, target: str, command: str, payload: Dict[str, Any]) -> Optional[tuple]:
+        """Response cache key, or None when the request must not be cached"""
+        if (target, command) not in RESPONSE_CACHE_TTLS:
+            return None
+        try:
+            canonical = json_dumps(payload, sort_keys=True)
+        except (TypeError, ValueError):
+            return None
+        digest = hashlib.blake2b(canonical, digest_size=16).digest()
+        
+        # File analyses are only reusable while the file is unchanged
+        if command == 'analyze_file':
+            try:
+                stat = os.stat(payload['file_path'])
+            except (KeyError, TypeError, ValueError, OSError):
+                return None
+            return (target, command, digest, stat.st_mtime_ns, stat.st_size)
+        return (target, command, digest)
+        
+    def _cached_response(self, key: tuple) -> Optional[Dict[str, Any]]:
+        """Return a fresh cached response, dropping it if it has expired"""
+        with self._cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is None:
+                return None
+            expires, response = entry
+            if expires < time.monotonic():
+                del self._response_cache[key]
+                return None
+            self._response_cache.move_to_end(key)
+            return response
+            
+    def _cache_response(self, key: tuple, response: Dict[str, Any]):
+        """Store a response, evicting the least recently used entry when full"""
+        expires = time.monotonic() + RESPONSE_CACHE_TTLS[key[:2]]
+        with self._cache_lock:
+            self._response_cache[key] = (expires, response)
+            self._response_cache.move_to_end(key)
+            if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
             
     def _handle_system_request(self, command: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Handle system-level requests"""
-        if command == 'health_check':
-            return {
-                "success": True,
-                "type": "response",
-                "payload": {
-                    "status": "healthy",
-                    "modules_loaded": self.stats['modules_loaded'],
-                    "uptime": time.time() - self.stats['start_time'],
-                    "requests_processed": self.stats['requests_processed']
-                }
-            }
+        handler = self._system_commands.get(command)
+        if handler is None:
+            return _error_response("command_error", f"Unknown system command: {command}")
+        return handler(payload)
+        
+    def _system_health_check(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Service liveness and basic counters"""
+        return _ok_response({
+            "status": "healthy",
+            "modules_loaded": self.stats['modules_loaded'],
+            "uptime": (time.monotonic_ns() - self._start_ns) / 1e9,
+            "requests_processed": self.stats['requests_processed']
+        })
             
-        elif command == 'get_status':
-            return {
-                "success": True,
-                "type": "response", 
-                "payload": {
-                    "status": {
-                        "service_running": self.running,
-                        "modules_health": self._module_health,
-                        "stats": self.stats
-                    }
-                }
-            }
-            
-        else:
-            return {
-                "success": False,
-                "error": f"Unknown system command: {command}",
-                "type": "command_error",
-                "payload": {}
+    def _system_get_status(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Detailed service, module and statistics status"""
+        return _ok_response({
+            "status": {
+                "service_running": self.running,
+                "modules_health": self._module_health,
+                "stats": self.stats
             }
+        })
             
     def _handle_python_analysis(self, command: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle Python analysis requests (stubbed)"""
+        """Handle Python analysis requests"""
         if command == 'analyze_file':
             file_path = payload.get('file_path')
             if not file_path:
-                return {
-                    "success": False,
-                    "type": "command_error",
-                    "error": "file_path is required",
-                    "payload": {}
-                }
-            # Stub analysis response
+                return _error_response("command_error", "file_path is required")
+            elements: List[Dict[str, Any]] = []
+            metrics = {"lines_of_code": 0, "functions_count": 0, "classes_count": 0}
+            try:
+                elements, metrics = self._analyze_source(file_path, payload.get('content'))
+            except ValueError as e:
+                return _error_response("command_error", str(e))
+            except (OSError, SyntaxError) as e:
+                # Unsaved or half-typed code: report empty metrics rather than fail
+                self.logger.debug("Could not parse %s: %s", file_path, e)
             analysis = {
                 "file_path": file_path,
-                "elements": [],
-                "metrics": {"lines_of_code": 0, "functions_count": 0, "classes_count": 0}
-            }
-            return {
-                "success": True,
-                "type": "response",
-                "payload": {"analysis": analysis}
+                "elements": elements,
+                "metrics": metrics
             }
+            return _ok_response({"analysis": analysis})
         else:
-            return {
-                "success": False,
-                "type": "command_error",
-                "error": f"Unknown python_intelligence command: {command}",
-                "payload": {}
-            }
+            return _error_response("command_error", f"Unknown python_intelligence command: {command}")
             
+    def _analyze_source(self, file_path: str, content: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Analyze a file (or unsaved content), reusing the result while it is unchanged"""
+        if content is not None:
+            source = content.encode()
+            if len(source) > MAX_ANALYZE_BYTES:
+                raise ValueError(f"content exceeds {MAX_ANALYZE_BYTES} bytes")
+            key = ('<content>', hashlib.blake2b(source, digest_size=16).digest())
+        else:
+            st = os.stat(file_path)
+            if not stat.S_ISREG(st.st_mode):
+                raise ValueError("file_path is not a regular file")
+            if st.st_size > MAX_ANALYZE_BYTES:
+                raise ValueError(f"File exceeds {MAX_ANALYZE_BYTES} bytes")
+            key = (file_path, st.st_mtime_ns, st.st_size)
+            source = None
+            
+        with self._analysis_lock:
+            cached = self._analysis_cache.get(key)
+            if cached is not None:
+                self._analysis_cache.move_to_end(key)
+                return cached
+                
+        if source is None:
+            source = _read_source(file_path)
+        tree = ast.parse(source, filename=file_path)
+        metrics = {"lines_of_code": len(CODE_LINE_PATTERN.findall(source))}
+        
+        visitor_class = _python_ast_visitor()
+        if visitor_class is not None:
+            # Same elements and counts PythonCodeAnalyzer reports for the file
+            visitor = visitor_class(file_path)
+            visitor.visit(tree)
+            elements = [asdict(element) for element in visitor.elements]
+            metrics["functions_count"] = sum(1 for e in elements if e['type'] == 'function')
+            metrics["classes_count"] = sum(1 for e in elements if e['type'] == 'class')
+        else:
+            elements = []
+            metrics["functions_count"] = metrics["classes_count"] = 0
+            for node in ast.walk(tree):
+                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    metrics["functions_count"] += 1
+                elif isinstance(node, ast.ClassDef):
+                    metrics["classes_count"] += 1
+        entry = (elements, metrics)
+        
+        with self._analysis_lock:
+            self._analysis_cache[key] = entry
+            if len(self._analysis_cache) > ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+        return entry
+        
     def _handle_llm_request(self, command: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Handle LLM provider requests"""
-        # LLM health check stubbed
-        if command == 'health_check':
-            return {
-                "success": True,
-                "type": "response",
-                "payload": {}
-            }
+        handler = self._llm_commands.get(command)
+        if handler is None:
+            return _error_response("command_error", f"Unknown llm_provider command: {command}")
+        return handler(payload)
+        
+    def _llm_health_check(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Stubbed LLM health check that always succeeds"""
+        return _ok_response({})
+        
+    def _llm_generate(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate a completion through the LLM provider module"""
         module = self._get_module('llm_provider')
         if not module:
-            return {
-                "success": False,
-                "error": "LLM provider module not available",
-                "type": "module_error",
-                "payload": {}
-            }
+            return _error_response("module_error", "LLM provider module not available")
             
         try:
-            if command == 'generate':
-                request_data = payload.get('request', {})
-                prompt = request_data.get('prompt')
-                
-                if not prompt:
-                    return {
-                        "success": False,
-                        "error": "prompt is required",
-                        "type": "parameter_error",
-                        "payload": {}
-                    }
-                
-                # Generate response
-                response = module.generate_response(
-                    prompt=prompt,
-                    model_preference=request_data.get('model_preference', 'medium'),
-                    max_tokens=request_data.get('max_tokens', 1000),
-                    temperature=request_data.get('temperature', 0.3)
-                )
-                
-                return {
-                    "success": True,
-                    "type": "response",
-                    "payload": {
-                        "response": {
-                            "content": response
-                        }
-                    }
-                }
-                
-            elif command == 'health_check':
-                """Stubbed LLM health check to always succeed"""
-                return {
-                    "success": True,
-                    "type": "response",
-                    "payload": {}
-                }
-                
-            else:
-                return {
-                    "success": False,
-                    "error": f"Unknown llm_provider command: {command}",
-                    "type": "command_error",
-                    "payload": {}
-                }
+            request_data = payload.get('request', {})
+            prompt = request_data.get('prompt')
+            
+            if not prompt:
+                return _error_response("parameter_error", "prompt is required")
+            
+            # Generate response
+            response = module.generate_response(
+                prompt=prompt,
+                model_preference=request_data.get('model_preference', 'medium'),
+                max_tokens=request_data.get('max_tokens', 1000),
+                temperature=request_data.get('temperature', 0.3)
+            )
+            
+            return _ok_response({"response": {"content": response}})
                 
         except Exception as e:
-            self.logger.error(f"LLM request error: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "type": "llm_error",
-                "payload": {}
-            }
+            self.logger.error("LLM request error: %s", e)
+            return _error_response("llm_error", str(e))
             
     def _handle_git_request(self, command: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Handle Git semantic commit requests"""
         module = self._get_module('git_semantic')
         if not module:
-            return {
-                "success": False,
-                "error": "Git semantic module not available",
-                "type": "module_error",
-                "payload": {}
-            }
+            return _error_response("module_error", "Git semantic module not available")
             
         try:
             if command == 'generate_commit':
@@ -434,41 +720,20 @@ class VSCodeBackendService:
                 # Generate semantic commit
                 commit_data = module.generate_commit_message(include_unstaged)
                 
-                return {
-                    "success": True,
-                    "type": "response",
-                    "payload": {
-                        "commit": commit_data
-                    }
-                }
+                return _ok_response({"commit": commit_data})
                 
             else:
-                return {
-                    "success": False,
-                    "error": f"Unknown git_semantic command: {command}",
-                    "type": "command_error",
-                    "payload": {}
-                }
+                return _error_response("command_error", f"Unknown git_semantic command: {command}")
                 
         except Exception as e:
-            self.logger.error(f"Git request error: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "type": "git_error",
-                "payload": {}
-            }
+            self.logger.error("Git request error: %s", e)
+            return _error_response("git_error", str(e))
             
     def _handle_test_generation(self, command: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Handle test generation requests"""
         module = self._get_module('test_generator')
         if not module:
-            return {
-                "success": False,
-                "error": "Test generator module not available",
-                "type": "module_error",
-                "payload": {}
-            }
+            return _error_response("module_error", "Test generator module not available")
             
         try:
             if command == 'generate_tests':
@@ -476,51 +741,25 @@ class VSCodeBackendService:
                 test_type = payload.get('test_type', 'unit')
                 
                 if not file_path:
-                    return {
-                        "success": False,
-                        "error": "file_path is required",
-                        "type": "parameter_error",
-                        "payload": {}
-                    }
+                    return _error_response("parameter_error", "file_path is required")
                 
                 # Generate tests
                 test_suite = module.generate_test_suite(file_path, test_type)
                 
-                return {
-                    "success": True,
-                    "type": "response",
-                    "payload": {
-                        "test_suite": test_suite
-                    }
-                }
+                return _ok_response({"test_suite": test_suite})
                 
             else:
-                return {
-                    "success": False,
-                    "error": f"Unknown test_generator command: {command}",
-                    "type": "command_error",
-                    "payload": {}
-                }
+                return _error_response("command_error", f"Unknown test_generator command: {command}")
                 
         except Exception as e:
-            self.logger.error(f"Test generation error: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "type": "test_generation_error",
-                "payload": {}
-            }
+            self.logger.error("Test generation error: %s", e)
+            return _error_response("test_generation_error", str(e))
             
     def _handle_refactoring(self, command: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Handle refactoring engine requests"""
         module = self._get_module('refactoring_engine')
         if not module:
-            return {
-                "success": False,
-                "error": "Refactoring engine module not available",
-                "type": "module_error",
-                "payload": {}
-            }
+            return _error_response("module_error", "Refactoring engine module not available")
             
         try:
             if command == 'analyze_refactoring_opportunities':
@@ -528,82 +767,74 @@ class VSCodeBackendService:
                 code = payload.get('code')
                 
                 if not file_path or not code:
-                    return {
-                        "success": False,
-                        "error": "file_path and code are required",
-                        "type": "parameter_error",
-                        "payload": {}
-                    }
+                    return _error_response("parameter_error", "file_path and code are required")
                 
                 # Analyze refactoring opportunities
                 refactoring_actions = module.analyze_refactoring_opportunities(file_path, code)
                 
-                return {
-                    "success": True,
-                    "type": "response",
-                    "payload": {
-                        "refactoring_actions": refactoring_actions
-                    }
-                }
+                return _ok_response({"refactoring_actions": refactoring_actions})
                 
             else:
-                return {
-                    "success": False,
-                    "error": f"Unknown refactoring_engine command: {command}",
-                    "type": "command_error",
-                    "payload": {}
-                }
+                return _error_response("command_error", f"Unknown refactoring_engine command: {command}")
                 
         except Exception as e:
-            self.logger.error(f"Refactoring error: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "type": "refactoring_error",
-                "payload": {}
-            }
+            self.logger.error("Refactoring error: %s", e)
+            return _error_response("refactoring_error", str(e))
             
-    def _health_monitor(self):
-        """Background health monitoring for modules"""
-        while self.running:
-            try:
-                for module_name in list(self._module_health.keys()):
-                    module = self._modules.get(module_name)
-                    if module and hasattr(module, 'health_check'):
-                        try:
-                            is_healthy = module.health_check()
-                            self._module_health[module_name] = is_healthy
-                        except:
-                            self._module_health[module_name] = False
-                            
-                time.sleep(30)  # Check health every 30 seconds
-                
-            except Exception as e:
-                self.logger.error(f"Health monitor error: {e}")
-                time.sleep(30)
+    def _check_module_health(self):
+        """Refresh module health; runs on the worker pool every HEALTH_CHECK_INTERVAL"""
+        try:
+            for module_name in list(self._module_health.keys()):
+                module = self._modules.get(module_name)
+                if module and hasattr(module, 'health_check'):
+                    try:
+                        is_healthy = module.health_check()
+                        self._module_health[module_name] = is_healthy
+                    except:
+                        self._module_health[module_name] = False
+                        
+        except Exception as e:
+            self.logger.error("Health monitor error: %s", e)
                 
+    def stop(self):
+        """Ask a running service loop to exit; safe to call from another thread"""
+        self.running = False
+        try:
+            self._stop_sock.send(b'\0', zmq.NOBLOCK)
+        except zmq.ZMQError:
+            pass
+            
     def shutdown(self):
         """Gracefully shutdown the service"""
         self.logger.info("Shutting down Aura VS Code Backend Service...")
         self.running = False
         
+        # Let in-flight requests finish before their sockets are closed
+        self._executor.shutdown(wait=True)
+        
         # Close modules
         for module_name, module in self._modules.items():
             try:
                 if hasattr(module, 'shutdown'):
                     module.shutdown()
             except Exception as e:
-                self.logger.error(f"Error shutting down module {module_name}: {e}")
+                self.logger.error("Error shutting down module %s: %s", module_name, e)
                 
-        # Close ZeroMQ socket
+        # Close ZeroMQ sockets
+        for sock in self._worker_socks:
+            sock.close()
+        self._reply_sock.close()
         self.socket.close()
-        self.context.term()
+        self._stop_sock.close()
+        self._wake_sock.close()
+        # The context is the process-wide instance, so it is left for other
+        # users; LINGER 0 above means nothing waits on undelivered replies
         
         self.logger.info("Service shutdown complete")
 
 
-def main():
-    """Main entry point for the service"""
+def main(argv: Optional[List[str]] = None):
+    """Main entry point for the service; argv defaults to sys.argv[1:]"""
     print("🤖 Aura VS Code Backend Service")
     print("=" * 40)
     
@@ -611,15 +842,19 @@ def main():
     import argparse
     parser = argparse.ArgumentParser(description='Aura VS Code Backend Service')
     parser.add_argument('--port', type=int, default=5559, help='ZeroMQ port (default: 5559)')
+    endpoint_help = 'ZeroMQ endpoint to bind instead of tcp://*:PORT'
+    if DEFAULT_IPC_ENDPOINT:
+        endpoint_help += f', e.g. {DEFAULT_IPC_ENDPOINT} when VS Code runs on this machine'
+    parser.add_argument('--endpoint', help=endpoint_help)
     parser.add_argument('--debug', action='store_true', help='Enable debug logging')
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Setup logging level
     if args.debug:
         logging.getLogger().setLevel(logging.DEBUG)
         
     # Create and start service
-    service = VSCodeBackendService(port=args.port)
+    service = VSCodeBackendService(port=args.port, endpoint=args.endpoint)
     
     try:
         service.start_service()
@@ -0,0 +1,36 @@
+"""
+Aura VS Code Protocol
+=====================
+
+Wire-level settings and JSON helpers shared by the VS Code backend
+service, its launcher and the integration tester. Kept free of heavy
+imports so the launcher and tester can load it before pyzmq is known to
+be installed.
+"""
+
+import json
+import os
+from typing import Any
+
+# Unix socket the service can serve on when VS Code runs on the same machine;
+# skips the TCP/IP stack on every round-trip. Not available on Windows.
+DEFAULT_IPC_PATH = f"/tmp/aura-vscode-{os.getuid()}.sock" if hasattr(os, "getuid") else None
+
+# orjson parses straight from the zmq frame buffer and encodes to bytes in C;
+# fall back to the stdlib encoder when it is not installed
+try:
+    import orjson
+
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def json_dumps(obj: Any, sort_keys: bool = False) -> bytes:
+        option = _ORJSON_OPTIONS | orjson.OPT_SORT_KEYS if sort_keys else _ORJSON_OPTIONS
+        return orjson.dumps(obj, option=option)
+
+    json_loads = orjson.loads
+except ImportError:
+    def json_dumps(obj: Any, sort_keys: bool = False) -> bytes:
+        return json.dumps(obj, sort_keys=sort_keys).encode()
+
+    def json_loads(data) -> Any:
+        return json.loads(bytes(data))
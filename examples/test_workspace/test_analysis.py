@@ -14,18 +14,15 @@ def calculate_fibonacci(n: int) -> int:
     """
     if n <= 1:
         return n
-    return calculate_fibonacci(n - 1) + calculate_fibonacci(n - 2)
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
 
 
 def process_data(data_list):
     # Missing docstring
-    result = []
-    for item in data_list:
-        if item > 0:
-            result.append(item * 2)
-        else:
-            result.append(0)
-    return result
+    return [item * 2 if item > 0 else 0 for item in data_list]
 
 
 class DataProcessor:
@@ -36,13 +33,8 @@ class DataProcessor:
     
     def process(self, x):
         # Missing type hints and docstring
-        if x > 10:
-            if x < 100:
-                if x % 2 == 0:
-                    return x * 2
-                else:
-                    return x * 3
-            else:
-                return x
-        else:
+        if x <= 10:
             return 0
+        if x >= 100:
+            return x
+        return x * 2 if x % 2 == 0 else x * 3
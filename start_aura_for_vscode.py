@@ -7,7 +7,7 @@ Simple launcher script to start the Aura backend service for VS Code integration
 This script handles dependency checking, environment setup, and service startup.
 
 Usage:
-    python3 start_aura_for_vscode.py [--port 5559] [--debug]
+    python3 start_aura_for_vscode.py [--port 5559] [--debug] [--spawn]
 
 Author: Aura - Level 9 Autonomous AI Coding Assistant
 Date: 2025-06-15
@@ -17,16 +17,29 @@ import sys
 import os
 import subprocess
 import argparse
+import importlib.util
 from pathlib import Path
 
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).resolve().parent / "backend"))
+
+from vscode_protocol import DEFAULT_IPC_PATH
+
+# Backend modules that provide the main VS Code features
+KEY_MODULES = (
+    "intelligence/python_analyzer.py",
+    "llm/providers.py",
+    "git/semantic_commits.py",
+    "generation/test_generator.py",
+    "generation/refactoring_engine.py"
+)
+
 def check_dependencies():
     """Check if required dependencies are installed"""
-    missing_deps = []
-    
-    try:
-        import zmq
-    except ImportError:
-        missing_deps.append("pyzmq")
+    # find_spec only locates the package; importing pyzmq here would load
+    # libzmq just to throw it away before the service starts
+    missing_deps = [package for module, package in (("zmq", "pyzmq"),)
+                    if importlib.util.find_spec(module) is None]
     
     if missing_deps:
         print("❌ Missing required dependencies:")
@@ -45,20 +58,16 @@ def check_backend_modules():
         print(f"❌ Backend directory not found: {backend_dir}")
         return False
     
-    # Check key module files
-    key_modules = [
-        "intelligence/python_analyzer.py",
-        "llm/providers.py", 
-        "git/semantic_commits.py",
-        "generation/test_generator.py",
-        "generation/refactoring_engine.py"
-    ]
-    
-    missing_modules = []
-    for module in key_modules:
-        module_path = backend_dir / module
-        if not module_path.exists():
-            missing_modules.append(module)
+    # One directory listing per package instead of a stat() per module file
+    present = set()
+    for package in {os.path.dirname(module) for module in KEY_MODULES}:
+        try:
+            with os.scandir(backend_dir / package) as entries:
+                present.update(f"{package}/{entry.name}" for entry in entries)
+        except OSError:
+            pass  # Whole package missing; its modules are reported below
+    
+    missing_modules = [module for module in KEY_MODULES if module not in present]
     
     if missing_modules:
         print("⚠️  Some backend modules are missing (features may be limited):")
@@ -68,8 +77,9 @@ def check_backend_modules():
     
     return True
 
-def start_backend_service(port: int = 5559, debug: bool = False):
-    """Start the Aura backend service"""
+def start_backend_service(port: int = 5559, debug: bool = False, ipc_path: str = None,
+                          spawn: bool = False):
+    """Start the Aura backend service, in this process unless spawn is set"""
     backend_dir = Path(__file__).parent / "backend"
     service_script = backend_dir / "vscode_backend_service.py"
     
@@ -78,22 +88,29 @@ def start_backend_service(port: int = 5559, debug: bool = False):
         return False
     
     print("🚀 Starting Aura VS Code Backend Service...")
-    print(f"   Port: {port}")
+    print(f"   Port: {port}" if not ipc_path else f"   IPC: {ipc_path}")
     print(f"   Debug: {debug}")
     print(f"   Backend: {backend_dir}")
     print()
     
-    # Build command
-    cmd = [sys.executable, str(service_script), "--port", str(port)]
+    # Build service arguments
+    service_args = ["--port", str(port)]
+    if ipc_path:
+        service_args += ["--endpoint", f"ipc://{ipc_path}"]
     if debug:
-        cmd.append("--debug")
+        service_args.append("--debug")
     
     try:
-        # Change to backend directory
+        # Change to backend directory; the modules treat "." as the project root
         os.chdir(backend_dir)
         
-        # Start the service
-        subprocess.run(cmd, check=True)
+        if spawn:
+            # Separate interpreter, for when the service needs isolating
+            subprocess.run([sys.executable, str(service_script)] + service_args, check=True)
+        else:
+            # Run it here and skip a second interpreter start-up
+            from vscode_backend_service import main as service_main
+            service_main(service_args)
         
     except KeyboardInterrupt:
         print("\n⏹️  Service stopped by user")
@@ -101,6 +118,10 @@ def start_backend_service(port: int = 5559, debug: bool = False):
     except subprocess.CalledProcessError as e:
         print(f"❌ Service failed to start: {e}")
         return False
+    except SystemExit as e:
+        if e.code:
+            print(f"❌ Service failed to start: exit status {e.code}")
+            return False
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
         return False
@@ -116,6 +137,10 @@ def main():
     parser = argparse.ArgumentParser(description="Start Aura backend service for VS Code")
     parser.add_argument("--port", type=int, default=5559, help="ZeroMQ port (default: 5559)")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    parser.add_argument("--ipc-path", nargs="?", const=DEFAULT_IPC_PATH,
+                        help=f"Serve over a Unix socket instead of TCP (default path: {DEFAULT_IPC_PATH})")
+    parser.add_argument("--spawn", action="store_true",
+                        help="Run the service in a separate Python process")
     parser.add_argument("--check-only", action="store_true", help="Only check dependencies and exit")
     args = parser.parse_args()
     
@@ -137,7 +162,7 @@ def main():
     
     # Start service
     print("\n🚀 Starting service...")
-    success = start_backend_service(args.port, args.debug)
+    success = start_backend_service(args.port, args.debug, args.ipc_path, args.spawn)
     
     if success:
         print("\n✅ Service started successfully!")
@@ -140,9 +140,18 @@ def test_vscode_extension():
             "out/extension.js"
         ]
         
+        # One directory listing per folder instead of a stat() per file
+        present = set()
+        for folder in {os.path.dirname(file) for file in required_files}:
+            try:
+                with os.scandir(extension_path / folder) as entries:
+                    present.update(f"{folder}/{entry.name}" if folder else entry.name
+                                   for entry in entries)
+            except OSError:
+                pass  # Missing folder; its files are reported below
+        
         for file in required_files:
-            file_path = extension_path / file
-            if file_path.exists():
+            if file in present:
                 print(f"✅ {file} exists")
             else:
                 print(f"❌ {file} missing")
@@ -160,25 +169,32 @@ async def main():
     print("🚀 Starting Aura Integration Tests")
     print("=" * 50)
     
+    # (name, function, is_coroutine) - the coroutine check is done once here
     tests = [
-        ("LLM Integration", test_llm_integration),
-        ("Security Integration", test_security_integration), 
-        ("Git Integration", test_git_integration),
-        ("Code Generation", test_code_generation),
-        ("VSCode Extension", lambda: test_vscode_extension())
+        (test_name, test_func, asyncio.iscoroutinefunction(test_func))
+        for test_name, test_func in (
+            ("LLM Integration", test_llm_integration),
+            ("Security Integration", test_security_integration),
+            ("Git Integration", test_git_integration),
+            ("Code Generation", test_code_generation),
+            ("VSCode Extension", test_vscode_extension)
+        )
     ]
     
+    # The tests are independent; run them together, with the blocking
+    # filesystem check on a worker thread so it doesn't hold up the loop
+    outcomes = await asyncio.gather(
+        *(test_func() if is_coroutine else asyncio.to_thread(test_func)
+          for _, test_func, is_coroutine in tests),
+        return_exceptions=True
+    )
+    
     results = []
-    for test_name, test_func in tests:
-        try:
-            if asyncio.iscoroutinefunction(test_func):
-                result = await test_func()
-            else:
-                result = test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"❌ {test_name} failed with exception: {e}")
-            results.append((test_name, False))
+    for (test_name, _, _), outcome in zip(tests, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"❌ {test_name} failed with exception: {outcome}")
+            outcome = False
+        results.append((test_name, outcome))
     
     print("\n" + "=" * 50)
     print("🏁 Integration Test Results:")
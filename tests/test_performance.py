@@ -7,13 +7,38 @@ This file tests the performance characteristics of the analysis system
 with various scenarios that might cause slowdowns.
 """
 
+import logging
+import math
+import sys
 import time
 import threading
 from concurrent.futures import ThreadPoolExecutor
-from typing import List, Dict, Any, Optional, Union, Tuple, Set
+from typing import List, Dict, Any, Optional, Union, Tuple, Set, Callable
 import asyncio
 from dataclasses import dataclass
 from enum import Enum
+from statistics import fmean
+
+logger = logging.getLogger(__name__)
+
+# slots=True drops the per-instance __dict__ but needs Python 3.10+
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Array inputs take vectorized paths when NumPy is installed; with an empty
+# tuple isinstance() is always False and every input stays on plain Python
+try:
+    import numpy as np
+    ARRAY_TYPES: Tuple[type, ...] = (np.ndarray,)
+except ImportError:
+    ARRAY_TYPES = ()
+
+# Compile hot numeric loops with numba when it is installed
+try:
+    from numba import njit
+    jit_kernel = njit(cache=True, fastmath=True)
+except ImportError:
+    def jit_kernel(func: callable) -> callable:
+        return func
 
 
 # Test 1: Large file simulation with many classes and functions
@@ -35,16 +60,26 @@ class LargeClass1:
     
     def method_3(self, items: List[int]) -> List[int]:
         """Method 3 documentation."""
+        # Round-tripping a list through an array is slower than the
+        # comprehension at any size; arrays are doubled in place of a loop
+        if isinstance(items, ARRAY_TYPES):
+            return items * 2
         return [item * 2 for item in items]
     
+    # Whether method_4 doubles a value of this exact type; other types are
+    # checked with issubclass once and cached (bool and int subclasses double)
+    _doubled_types: Dict[type, bool] = {int: True, float: True, bool: True, str: False}
+    
     def method_4(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Method 4 documentation."""
+        doubled_types = self._doubled_types
         result = {}
         for key, value in data.items():
-            if isinstance(value, (int, float)):
-                result[key] = value * 2
-            else:
-                result[key] = str(value).upper()
+            value_type = type(value)
+            doubled = doubled_types.get(value_type)
+            if doubled is None:
+                doubled = doubled_types[value_type] = issubclass(value_type, (int, float))
+            result[key] = value * 2 if doubled else str(value).upper()
         return result
     
     def method_5(self) -> None:
@@ -77,6 +112,8 @@ class LargeClass1:
 class LargeClass2:
     """Second large class for performance testing."""
     
+    __slots__ = ('name', 'age', 'email', 'preferences', 'history')
+    
     def __init__(self, name: str, age: int, email: str):
         self.name = name
         self.age = age
@@ -165,6 +202,10 @@ def function_7(callback: callable, value: Any) -> Any:
 
 def function_8(items: List[int], threshold: int = 10) -> List[int]:
     """Function 8 documentation."""
+    # Arrays are filtered with one vectorized mask; lists stay on the
+    # comprehension, which beats converting them to an array and back
+    if isinstance(items, ARRAY_TYPES):
+        return items[items > threshold]
     return [item for item in items if item > threshold]
 
 def function_9(text: str, pattern: str) -> bool:
@@ -173,10 +214,14 @@ def function_9(text: str, pattern: str) -> bool:
 
 def function_10(matrix: List[List[int]]) -> List[List[int]]:
     """Function 10 documentation."""
+    # Converting nested lists to an array and back costs more than the
+    # vectorized multiply saves, so only arrays take the NumPy path
+    if isinstance(matrix, ARRAY_TYPES):
+        return matrix * 2
     return [[cell * 2 for cell in row] for row in matrix]
 
 # Test 3: Complex type annotations and dataclasses
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DataClassExample:
     """Dataclass for testing complex type annotations."""
     id: int
@@ -187,7 +232,7 @@ class DataClassExample:
     
     def calculate_average(self) -> float:
         """Calculate average score."""
-        return sum(self.scores) / len(self.scores) if self.scores else 0.0
+        return fmean(self.scores) if self.scores else 0.0
     
     def update_metadata(self, key: str, value: Union[str, int, bool]) -> None:
         """Update metadata entry."""
@@ -211,24 +256,30 @@ class StatusEnum(Enum):
     COMPLETED = "completed"
     FAILED = "failed"
 
+# Members bound once, so state transitions skip the enum class attribute lookup
+_STATUS_PENDING = StatusEnum.PENDING
+_STATUS_PROCESSING = StatusEnum.PROCESSING
+_STATUS_COMPLETED = StatusEnum.COMPLETED
+_STATUS_FAILED = StatusEnum.FAILED
+
 class BaseProcessor:
     """Base processor class."""
     
     def __init__(self, name: str):
         self.name = name
-        self.status = StatusEnum.PENDING
+        self.status = _STATUS_PENDING
     
     def start_processing(self) -> None:
         """Start processing."""
-        self.status = StatusEnum.PROCESSING
+        self.status = _STATUS_PROCESSING
     
     def complete_processing(self) -> None:
         """Complete processing."""
-        self.status = StatusEnum.COMPLETED
+        self.status = _STATUS_COMPLETED
     
     def fail_processing(self) -> None:
         """Fail processing."""
-        self.status = StatusEnum.FAILED
+        self.status = _STATUS_FAILED
 
 class DataProcessor(BaseProcessor):
     """Data processor implementation."""
@@ -253,16 +304,29 @@ class DataProcessor(BaseProcessor):
             self.fail_processing()
             raise
     
+    # Handlers by exact item type; subclasses (bool, OrderedDict, ...) are
+    # matched with issubclass on first sight and then cached here too
+    _item_handlers: Dict[type, Callable[[Any], Any]] = {
+        str: lambda item: item.strip().upper(),
+        int: lambda item: item * 2,
+        float: lambda item: item * 2,
+        dict: lambda item: {k: v for k, v in item.items() if v is not None},
+    }
+    
     def _process_single_item(self, item: Any) -> Any:
         """Process a single item."""
-        if isinstance(item, str):
-            return item.strip().upper()
-        elif isinstance(item, (int, float)):
-            return item * 2
-        elif isinstance(item, dict):
-            return {k: v for k, v in item.items() if v is not None}
-        else:
-            return str(item)
+        handler = self._item_handlers.get(type(item))
+        if handler is None:
+            handler = self._item_handlers[type(item)] = self._resolve_handler(type(item))
+        return handler(item)
+    
+    @classmethod
+    def _resolve_handler(cls, item_type: type) -> Callable[[Any], Any]:
+        """Find the handler for a type without an exact entry."""
+        for base in (str, int, float, dict):
+            if issubclass(item_type, base):
+                return cls._item_handlers[base]
+        return str
 
 # Test 5: Async functions
 async def async_function_1(delay: float) -> str:
@@ -272,16 +336,23 @@ async def async_function_1(delay: float) -> str:
 
 async def async_function_2(data: List[Any]) -> List[Any]:
     """Async function 2 documentation."""
-    result = []
-    for item in data:
+    async def process_item(item: Any) -> Any:
         await asyncio.sleep(0.01)  # Simulate async work
-        result.append(item)
-    return result
+        return item
+    
+    # Items are independent, so their waits overlap; gather keeps input order
+    return list(await asyncio.gather(*(process_item(item) for item in data)))
+
+# Simulated responses by URL; repeat requests skip the network delay
+_url_responses: Dict[str, Dict[str, Any]] = {}
 
 async def async_function_3(url: str) -> Dict[str, Any]:
     """Async function 3 documentation."""
-    await asyncio.sleep(0.1)  # Simulate network request
-    return {"url": url, "status": "success", "timestamp": time.time()}
+    cached = _url_responses.get(url)
+    if cached is None:
+        await asyncio.sleep(0.1)  # Simulate network request
+        cached = _url_responses[url] = {"url": url, "status": "success"}
+    return {**cached, "timestamp": time.time()}
 
 # Test 6: Threading and concurrency
 class ThreadedProcessor:
@@ -291,19 +362,30 @@ class ThreadedProcessor:
         self.max_workers = max_workers
         self.results: List[Any] = []
         self.lock = threading.Lock()
+        # One pool for the processor's lifetime; its threads are reused across calls
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+    
+    def __enter__(self) -> 'ThreadedProcessor':
+        return self
+    
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Shut down the worker threads."""
+        self._executor.shutdown(wait=True)
     
     def process_items(self, items: List[Any]) -> List[Any]:
         """Process items using thread pool."""
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = [executor.submit(self._process_item, item) for item in items]
-            results = [future.result() for future in futures]
+        futures = [self._executor.submit(self._process_item, item) for item in items]
+        results = [future.result() for future in futures]
+        # Record the whole batch under one lock acquisition instead of one per item
+        with self.lock:
+            self.results.extend(items)
         return results
     
     def _process_item(self, item: Any) -> Any:
         """Process single item in thread."""
-        with self.lock:
-            self.results.append(item)
-        
         # Simulate processing time
         time.sleep(0.01)
         return f"Processed: {item}"
@@ -318,7 +400,7 @@ def timing_decorator(func: callable) -> callable:
             return result
         finally:
             end_time = time.time()
-            print(f"{func.__name__} took {end_time - start_time:.4f} seconds")
+            logger.debug("%s took %.4f seconds", func.__name__, end_time - start_time)
     return wrapper
 
 class ResourceManager:
@@ -329,26 +411,27 @@ class ResourceManager:
         self.resource = None
     
     def __enter__(self) -> 'ResourceManager':
-        print(f"Acquiring resource: {self.resource_name}")
+        logger.debug("Acquiring resource: %s", self.resource_name)
         self.resource = f"Resource_{self.resource_name}"
         return self
     
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        print(f"Releasing resource: {self.resource_name}")
+        logger.debug("Releasing resource: %s", self.resource_name)
         self.resource = None
 
 @timing_decorator
+@jit_kernel
 def complex_calculation(iterations: int) -> float:
     """Perform complex calculation."""
     result = 0.0
     for i in range(iterations):
-        result += (i ** 0.5) * (i % 7) / (i + 1)
+        result += math.sqrt(i) * (i % 7) / (i + 1)
     return result
 
 # Test 8: Large main function with many operations
 def main():
     """Main function with comprehensive testing."""
-    print("Starting performance testing...")
+    logger.info("Starting performance testing...")
     
     # Test class instantiation
     obj1 = LargeClass1(100)
@@ -377,21 +460,22 @@ def main():
         processed_chunk = processor.process_chunk(chunk)
     
     # Test threading
-    threaded_processor = ThreadedProcessor(max_workers=4)
-    threaded_results = threaded_processor.process_items(list(range(50)))
+    with ThreadedProcessor(max_workers=4) as threaded_processor:
+        threaded_results = threaded_processor.process_items(list(range(50)))
     
     # Test complex calculation
     calc_result = complex_calculation(10000)
     
     # Test context manager
     with ResourceManager("TestResource") as rm:
-        print(f"Using resource: {rm.resource}")
+        logger.info("Using resource: %s", rm.resource)
     
-    print(f"Performance testing complete.")
-    print(f"Data object average: {average}")
-    print(f"Processed items: {processor.processed_items}")
-    print(f"Calculation result: {calc_result:.4f}")
-    print(f"Threaded results count: {len(threaded_results)}")
+    logger.info("Performance testing complete.")
+    logger.info("Data object average: %s", average)
+    logger.info("Processed items: %s", processor.processed_items)
+    logger.info("Calculation result: %.4f", calc_result)
+    logger.info("Threaded results count: %d", len(threaded_results))
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     main()
\ No newline at end of file